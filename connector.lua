@@ -43,6 +43,7 @@ SUPPORTED COMMANDS:
     Emulator Control:
         - SET_INPUT <mask>              → Set button state (bitmask)
         - FRAME_ADVANCE <count>         → Run emulator for N frames
+        - WAIT_FRAMES <count>           → Reply "OK" after N more frames
         - RESET                         → Reset the emulator
     
     RL-Specific Commands:
@@ -61,6 +62,18 @@ VERSION: 2.0 (with RL commands)
 ================================================================================
 --]]
 
+-- =============================================================================
+-- CONFIGURATION
+-- =============================================================================
+
+-- Per-command debug logging. Off by default: the console is slow enough that
+-- logging every poll costs real time in training loops. Connection events and
+-- errors are always logged. Toggle at runtime with the VERBOSE command.
+local VERBOSE = false
+
+-- Horizontal rule framing console banners
+local RULE = string.rep("=", 80)
+
 -- =============================================================================
 -- INITIALIZATION
 -- =============================================================================
@@ -83,26 +96,37 @@ if not ok then
 end
 
 -- Display startup message with available commands
-console:log("================================================================================")
-console:log("Battle Factory RL Agent - mGBA Connector v2.1 (Frame-Based Input)")
-console:log("================================================================================")
-console:log("Listening on port 7777")
-console:log("")
-console:log("Memory Commands:")
-console:log("  PING, READ_BLOCK, READ_U16, READ_U32, READ_PTR, READ_PTR_U16, WRITE_BYTE")
-console:log("")
-console:log("Input Commands (Frame-Based - works with fast-forward):")
-console:log("  TAP_BUTTON <mask> [frames]  - Press button for N frames (default: 8)")
-console:log("  HOLD_BUTTON <mask> <frames> - Hold button for exact N frames")
-console:log("  GET_FRAME                   - Get current frame number")
-console:log("  CLEAR_KEY_QUEUE             - Cancel all pending button presses")
-console:log("")
-console:log("Legacy Input (may fail during fast-forward):")
-console:log("  SET_INPUT, FRAME_ADVANCE, RESET")
-console:log("")
-console:log("RL Commands:")
-console:log("  IS_WAITING_INPUT, GET_BATTLE_OUTCOME, READ_LAST_MOVES, READ_RNG")
-console:log("================================================================================")
+-- (a single console call: each log line is a separate UI update in mGBA)
+console:log(table.concat({
+    RULE,
+    "Battle Factory RL Agent - mGBA Connector v2.1 (Frame-Based Input)",
+    RULE,
+    "Listening on port 7777",
+    "",
+    "Memory Commands:",
+    "  PING, READ_BLOCK, READ_U16, READ_U32, READ_PTR, READ_PTR_U16, WRITE_BYTE",
+    "",
+    "Input Commands (Frame-Based - works with fast-forward):",
+    "  TAP_BUTTON <mask> [frames]  - Press button for N frames (default: 8)",
+    "  HOLD_BUTTON <mask> <frames> - Hold button for exact N frames",
+    "  TAP_SEQUENCE <mask>:<frames>:<wait> ... - Queue a whole sequence",
+    "  WAIT_FRAMES <count>         - Reply once N more frames have run",
+    "  GET_FRAME                   - Get current frame number",
+    "  CLEAR_KEY_QUEUE             - Cancel all pending button presses",
+    "",
+    "Savestates (in memory):",
+    "  SAVE_STATE [name], LOAD_STATE [name]",
+    "",
+    "Legacy Input (may fail during fast-forward):",
+    "  SET_INPUT, FRAME_ADVANCE, RESET",
+    "",
+    "RL Commands:",
+    "  IS_WAITING_INPUT, GET_BATTLE_OUTCOME, READ_LAST_MOVES, READ_RNG",
+    "",
+    "Debug:",
+    "  VERBOSE <0|1>               - Per-command logging (default: off)",
+    RULE
+}, "\n"))
 
 -- =============================================================================
 -- MEMORY ADDRESSES (BPEE - Pokemon Emerald USA)
@@ -150,9 +174,23 @@ local current_key_mask = 0
 -- Command counter for debugging
 local command_count = 0
 
+-- Received bytes of a command whose newline hasn't arrived yet
+local rx_pending = ""
+
 -- Frame counter (manually tracked since getFrameCount() may not be available)
 local frame_count = 0
 
+-- Frame at which a pending WAIT_FRAMES reply is due (nil when not waiting)
+local wait_until = nil
+
+-- Received commands not yet handled. Commands behind a WAIT_FRAMES stay here
+-- until its reply goes out, so replies keep the order commands arrived in.
+local command_queue = {}
+
+-- In-memory savestates keyed by name (SAVE_STATE / LOAD_STATE)
+-- Kept inside the emulator so restoring never ships the state over the socket
+local saved_states = {}
+
 -- =============================================================================
 -- FRAME-BASED KEY EVENT QUEUE
 -- =============================================================================
@@ -170,12 +208,13 @@ local keyEventQueue = {}
     Args:
         keyMask: GBA button bitmask
         duration: Number of frames to hold the button
+        delay: Optional number of frames to wait before pressing (default: 0)
     
-    The button will be pressed starting this frame and released after
-    'duration' frames have elapsed.
+    The button will be pressed starting 'delay' frames from now and released
+    after 'duration' frames have elapsed.
 --]]
-local function enqueueButton(keyMask, duration)
-    local startFrame = frame_count
+local function enqueueButton(keyMask, duration, delay)
+    local startFrame = frame_count + (delay or 0)
     local endFrame = startFrame + duration
     
     table.insert(keyEventQueue, {
@@ -185,8 +224,10 @@ local function enqueueButton(keyMask, duration)
         pressed = false
     })
     
-    console:log(string.format("[KEY_QUEUE] Enqueued mask=0x%03X for frames %d-%d (duration=%d)",
-        keyMask, startFrame, endFrame, duration))
+    if VERBOSE then
+        console:log(string.format("[KEY_QUEUE] Enqueued mask=0x%03X for frames %d-%d (duration=%d)",
+            keyMask, startFrame, endFrame, duration))
+    end
 end
 
 --[[
@@ -295,438 +336,653 @@ end
 -- =============================================================================
 
 --[[
-    Process a single command and return the response string.
+    Command handlers, keyed by command name.
     
-    This is the main dispatch function that routes commands to their handlers.
-    All commands return a single-line string response.
-    
-    @param line: The command string to process
-    @return: Response string to send back to client
+    Each handler receives the parsed command parts (parts[1] is the command
+    name itself) and returns the single-line response string.
 --]]
-function handleCommand(line)
-    local parts = parseCommand(line)
-    local cmd = parts[1]
-    
-    -- Increment command counter
-    command_count = command_count + 1
-    
-    -- =========================================================================
-    -- BASIC COMMANDS
-    -- =========================================================================
-    
-    if cmd == "PING" then
-        -- Simple connection test
-        -- Usage: PING
-        -- Returns: "PONG"
+local handlers = {}
+
+-- =========================================================================
+-- BASIC COMMANDS
+-- =========================================================================
+
+handlers.PING = function(parts)
+    -- Simple connection test
+    -- Usage: PING
+    -- Returns: "PONG"
+    if VERBOSE then
         console:log(string.format("[CMD #%d] PING -> PONG", command_count))
-        return "PONG"
-        
-    -- =========================================================================
-    -- MEMORY READING COMMANDS
-    -- =========================================================================
-        
-    elseif cmd == "READ_BLOCK" then
-        -- Read a contiguous block of memory as hexadecimal string
-        -- Usage: READ_BLOCK <address_hex> <size_hex>
-        -- Returns: Hex string of bytes (e.g., "0A1B2C3D...")
-        -- Example: READ_BLOCK 02024084 58  (reads 88 bytes of battle mon data)
-        
-        local addr = tonumber(parts[2], 16)
-        local size = tonumber(parts[3], 16)
-        if not addr or not size then
-            return "ERROR: Invalid address or size. Usage: READ_BLOCK <addr_hex> <size_hex>"
-        end
-        
-        -- Read each byte and convert to hex
-        local hex_str = ""
-        for i = 0, size - 1 do
-            local byte = emu:read8(addr + i)
-            hex_str = hex_str .. string.format("%02X", byte)
-        end
-        return hex_str
-        
-    elseif cmd == "READ_U16" then
-        -- Read a 16-bit unsigned integer (little-endian)
-        -- Usage: READ_U16 <address_hex>
-        -- Returns: Decimal value as string
-        -- Example: READ_U16 02024084  (reads species ID from battle mon)
-        
-        local addr = tonumber(parts[2], 16)
-        if not addr then
-            return "ERROR: Invalid address. Usage: READ_U16 <addr_hex>"
-        end
-        
-        -- GBA is little-endian: low byte first, then high byte
-        local lo = emu:read8(addr)
-        local hi = emu:read8(addr + 1)
-        local value = lo + (hi * 256)
-        return tostring(value)
-        
-    elseif cmd == "READ_U32" then
-        -- Read a 32-bit unsigned integer (little-endian)
-        -- Usage: READ_U32 <address_hex>
-        -- Returns: Decimal value as string
-        -- Example: READ_U32 03005D80  (reads RNG value)
-        
-        local addr = tonumber(parts[2], 16)
-        if not addr then
-            return "ERROR: Invalid address. Usage: READ_U32 <addr_hex>"
-        end
-        
-        -- Read 4 bytes in little-endian order
-        local b0 = emu:read8(addr)
-        local b1 = emu:read8(addr + 1)
-        local b2 = emu:read8(addr + 2)
-        local b3 = emu:read8(addr + 3)
-        local value = b0 + (b1 * 256) + (b2 * 65536) + (b3 * 16777216)
-        return tostring(value)
-        
-    elseif cmd == "READ_PTR" then
-        -- Read memory through pointer indirection
-        -- Usage: READ_PTR <ptr_addr_hex> <offset_hex> <size_hex>
-        -- Returns: Hex string of bytes at (ptr_value + offset)
-        -- 
-        -- This is essential for reading SaveBlock data where the base address
-        -- varies between game sessions.
-        -- Example: READ_PTR 03005D90 E70 48
-        --          (reads rental Pokemon from SaveBlock2 + 0xE70)
-        
-        local ptr_addr = tonumber(parts[2], 16)
-        local offset = tonumber(parts[3], 16)
-        local size = tonumber(parts[4], 16)
-        if not ptr_addr or not offset or not size then
-            return "ERROR: Invalid parameters. Usage: READ_PTR <ptr_hex> <offset_hex> <size_hex>"
-        end
-        
-        -- First, read the 4-byte pointer value
-        local b0 = emu:read8(ptr_addr)
-        local b1 = emu:read8(ptr_addr + 1)
-        local b2 = emu:read8(ptr_addr + 2)
-        local b3 = emu:read8(ptr_addr + 3)
-        local base_addr = b0 + (b1 * 256) + (b2 * 65536) + (b3 * 16777216)
-        
-        -- Calculate the target address and read the data
-        local target_addr = base_addr + offset
-        local hex_str = ""
-        for i = 0, size - 1 do
-            local byte = emu:read8(target_addr + i)
-            hex_str = hex_str .. string.format("%02X", byte)
-        end
-        return hex_str
-        
-    elseif cmd == "READ_PTR_U16" then
-        -- Read a 16-bit value through pointer indirection
-        -- Usage: READ_PTR_U16 <ptr_addr_hex> <offset_hex>
-        -- Returns: Decimal value as string
-        -- Example: READ_PTR_U16 03005D90 DE2
-        --          (reads Factory win streak from SaveBlock2 + 0xDE2)
-        
-        local ptr_addr = tonumber(parts[2], 16)
-        local offset = tonumber(parts[3], 16)
-        if not ptr_addr or not offset then
-            return "ERROR: Invalid parameters. Usage: READ_PTR_U16 <ptr_hex> <offset_hex>"
-        end
-        
-        -- Read pointer and dereference
-        local b0 = emu:read8(ptr_addr)
-        local b1 = emu:read8(ptr_addr + 1)
-        local b2 = emu:read8(ptr_addr + 2)
-        local b3 = emu:read8(ptr_addr + 3)
-        local base_addr = b0 + (b1 * 256) + (b2 * 65536) + (b3 * 16777216)
-        local target_addr = base_addr + offset
-        
-        -- Read u16 at target
-        local lo = emu:read8(target_addr)
-        local hi = emu:read8(target_addr + 1)
-        return tostring(lo + (hi * 256))
-    
-    -- =========================================================================
-    -- MEMORY WRITING COMMANDS
-    -- =========================================================================
-        
-    elseif cmd == "WRITE_BYTE" then
-        -- Write a single byte to memory
-        -- Usage: WRITE_BYTE <address_hex> <value_hex>
-        -- Returns: "OK" on success
-        -- WARNING: Writing to wrong addresses can crash the game!
-        
-        local addr = tonumber(parts[2], 16)
-        local val = tonumber(parts[3], 16)
-        if not addr or not val then
-            return "ERROR: Invalid address or value. Usage: WRITE_BYTE <addr_hex> <value_hex>"
-        end
-        
-        emu:write8(addr, val)
-        return "OK"
-    
-    -- =========================================================================
-    -- EMULATOR CONTROL COMMANDS
-    -- =========================================================================
-        
-    elseif cmd == "FRAME_ADVANCE" then
-        -- DEPRECATED: The emulator runs continuously, no need to advance frames.
-        -- Waits should be handled by Python using time.sleep().
-        -- Kept for backwards compatibility but does nothing.
-        -- Usage: FRAME_ADVANCE [count]
-        -- Returns: "OK" immediately
-        local count = tonumber(parts[2]) or 0
+    end
+    return "PONG"
+end
+
+-- =========================================================================
+-- MEMORY READING COMMANDS
+-- =========================================================================
+
+-- Raw byte -> two uppercase hex digits, built once for string.gsub
+local HEX_OF_BYTE = {}
+for b = 0, 255 do
+    HEX_OF_BYTE[string.char(b)] = string.format("%02X", b)
+end
+
+--[[
+    Read `size` bytes starting at `addr` as an uppercase hex string.
+
+    One readRange call plus a table-driven gsub, both in C, instead of a
+    read8 and a string concatenation per byte (quadratic in the block size).
+--]]
+local function readHex(addr, size)
+    if size <= 0 then
+        return ""
+    end
+    return (string.gsub(emu:readRange(addr, size), ".", HEX_OF_BYTE))
+end
+
+handlers.READ_BLOCK = function(parts)
+    -- Read a contiguous block of memory as hexadecimal string
+    -- Usage: READ_BLOCK <address_hex> <size_hex>
+    -- Returns: Hex string of bytes (e.g., "0A1B2C3D...")
+    -- Example: READ_BLOCK 02024084 58  (reads 88 bytes of battle mon data)
+
+    local addr = tonumber(parts[2], 16)
+    local size = tonumber(parts[3], 16)
+    if not addr or not size then
+        return "ERROR: Invalid address or size. Usage: READ_BLOCK <addr_hex> <size_hex>"
+    end
+
+    return readHex(addr, size)
+end
+
+handlers.READ_U16 = function(parts)
+    -- Read a 16-bit unsigned integer (little-endian)
+    -- Usage: READ_U16 <address_hex>
+    -- Returns: Decimal value as string
+    -- Example: READ_U16 02024084  (reads species ID from battle mon)
+
+    local addr = tonumber(parts[2], 16)
+    if not addr then
+        return "ERROR: Invalid address. Usage: READ_U16 <addr_hex>"
+    end
+
+    -- GBA is little-endian: low byte first, then high byte
+    local lo = emu:read8(addr)
+    local hi = emu:read8(addr + 1)
+    local value = lo + (hi * 256)
+    return tostring(value)
+end
+
+handlers.READ_U32 = function(parts)
+    -- Read a 32-bit unsigned integer (little-endian)
+    -- Usage: READ_U32 <address_hex>
+    -- Returns: Decimal value as string
+    -- Example: READ_U32 03005D80  (reads RNG value)
+
+    local addr = tonumber(parts[2], 16)
+    if not addr then
+        return "ERROR: Invalid address. Usage: READ_U32 <addr_hex>"
+    end
+
+    -- Read 4 bytes in little-endian order
+    local b0 = emu:read8(addr)
+    local b1 = emu:read8(addr + 1)
+    local b2 = emu:read8(addr + 2)
+    local b3 = emu:read8(addr + 3)
+    local value = b0 + (b1 * 256) + (b2 * 65536) + (b3 * 16777216)
+    return tostring(value)
+end
+
+handlers.READ_PTR = function(parts)
+    -- Read memory through pointer indirection
+    -- Usage: READ_PTR <ptr_addr_hex> <offset_hex> <size_hex>
+    -- Returns: Hex string of bytes at (ptr_value + offset)
+    -- 
+    -- This is essential for reading SaveBlock data where the base address
+    -- varies between game sessions.
+    -- Example: READ_PTR 03005D90 E70 48
+    --          (reads rental Pokemon from SaveBlock2 + 0xE70)
+
+    local ptr_addr = tonumber(parts[2], 16)
+    local offset = tonumber(parts[3], 16)
+    local size = tonumber(parts[4], 16)
+    if not ptr_addr or not offset or not size then
+        return "ERROR: Invalid parameters. Usage: READ_PTR <ptr_hex> <offset_hex> <size_hex>"
+    end
+
+    -- First, read the 4-byte pointer value
+    local b0 = emu:read8(ptr_addr)
+    local b1 = emu:read8(ptr_addr + 1)
+    local b2 = emu:read8(ptr_addr + 2)
+    local b3 = emu:read8(ptr_addr + 3)
+    local base_addr = b0 + (b1 * 256) + (b2 * 65536) + (b3 * 16777216)
+
+    -- Calculate the target address and read the data
+    return readHex(base_addr + offset, size)
+end
+
+handlers.READ_PTR_U16 = function(parts)
+    -- Read a 16-bit value through pointer indirection
+    -- Usage: READ_PTR_U16 <ptr_addr_hex> <offset_hex>
+    -- Returns: Decimal value as string
+    -- Example: READ_PTR_U16 03005D90 DE2
+    --          (reads Factory win streak from SaveBlock2 + 0xDE2)
+
+    local ptr_addr = tonumber(parts[2], 16)
+    local offset = tonumber(parts[3], 16)
+    if not ptr_addr or not offset then
+        return "ERROR: Invalid parameters. Usage: READ_PTR_U16 <ptr_hex> <offset_hex>"
+    end
+
+    -- Read pointer and dereference
+    local b0 = emu:read8(ptr_addr)
+    local b1 = emu:read8(ptr_addr + 1)
+    local b2 = emu:read8(ptr_addr + 2)
+    local b3 = emu:read8(ptr_addr + 3)
+    local base_addr = b0 + (b1 * 256) + (b2 * 65536) + (b3 * 16777216)
+    local target_addr = base_addr + offset
+
+    -- Read u16 at target
+    local lo = emu:read8(target_addr)
+    local hi = emu:read8(target_addr + 1)
+    return tostring(lo + (hi * 256))
+end
+
+-- =========================================================================
+-- MEMORY WRITING COMMANDS
+-- =========================================================================
+
+handlers.WRITE_BYTE = function(parts)
+    -- Write a single byte to memory
+    -- Usage: WRITE_BYTE <address_hex> <value_hex>
+    -- Returns: "OK" on success
+    -- WARNING: Writing to wrong addresses can crash the game!
+
+    local addr = tonumber(parts[2], 16)
+    local val = tonumber(parts[3], 16)
+    if not addr or not val then
+        return "ERROR: Invalid address or value. Usage: WRITE_BYTE <addr_hex> <value_hex>"
+    end
+
+    emu:write8(addr, val)
+    return "OK"
+end
+
+-- =========================================================================
+-- EMULATOR CONTROL COMMANDS
+-- =========================================================================
+
+handlers.FRAME_ADVANCE = function(parts)
+    -- DEPRECATED: The emulator runs continuously, no need to advance frames.
+    -- Waits should be handled by Python using time.sleep().
+    -- Kept for backwards compatibility but does nothing.
+    -- Usage: FRAME_ADVANCE [count]
+    -- Returns: "OK" immediately
+    local count = tonumber(parts[2]) or 0
+    if VERBOSE then
         local frame = get_frame_count()
         console:log(string.format("[CMD #%d] FRAME_ADVANCE(%d) -> OK (current frame=%d)", 
             command_count, count, frame))
-        return "OK"
-        
-    elseif cmd == "SET_INPUT" then
-        -- Set the button input state using a bitmask
-        -- Usage: SET_INPUT <button_mask>
-        -- Returns: "OK"
-        --
-        -- Button Bitmask Values:
-        --   A      = 0x001 (1)
-        --   B      = 0x002 (2)
-        --   SELECT = 0x004 (4)
-        --   START  = 0x008 (8)
-        --   RIGHT  = 0x010 (16)
-        --   LEFT   = 0x020 (32)
-        --   UP     = 0x040 (64)
-        --   DOWN   = 0x080 (128)
-        --   R      = 0x100 (256)
-        --   L      = 0x200 (512)
-        --
-        -- To press A+B simultaneously: SET_INPUT 3 (1+2)
-        -- To release all buttons: SET_INPUT 0
-        
-        local mask = tonumber(parts[2])
-        if not mask then
-            return "ERROR: Invalid mask. Usage: SET_INPUT <button_mask_decimal>"
-        end
-        
-        -- Decode and log button press
-        local button_names = decode_button_mask(mask)
+    end
+    return "OK"
+end
+
+handlers.SET_INPUT = function(parts)
+    -- Set the button input state using a bitmask
+    -- Usage: SET_INPUT <button_mask>
+    -- Returns: "OK"
+    --
+    -- Button Bitmask Values:
+    --   A      = 0x001 (1)
+    --   B      = 0x002 (2)
+    --   SELECT = 0x004 (4)
+    --   START  = 0x008 (8)
+    --   RIGHT  = 0x010 (16)
+    --   LEFT   = 0x020 (32)
+    --   UP     = 0x040 (64)
+    --   DOWN   = 0x080 (128)
+    --   R      = 0x100 (256)
+    --   L      = 0x200 (512)
+    --
+    -- To press A+B simultaneously: SET_INPUT 3 (1+2)
+    -- To release all buttons: SET_INPUT 0
+
+    local mask = tonumber(parts[2])
+    if not mask then
+        return "ERROR: Invalid mask. Usage: SET_INPUT <button_mask_decimal>"
+    end
+
+    -- Decode and log button press
+    if VERBOSE then
         local frame = get_frame_count()
         local mask_hex = string.format("0x%03X", mask)
-        
         if mask == 0 then
             console:log(string.format("[INPUT] Frame %d: RELEASE ALL BUTTONS (mask=%s)", frame, mask_hex))
         else
             console:log(string.format("[INPUT] Frame %d: PRESS %s (mask=%s, decimal=%d)", 
-                frame, button_names, mask_hex, mask))
-        end
-        
-        -- Store the mask for use in FRAME_ADVANCE
-        current_key_mask = mask
-        
-        -- Clear all buttons first
-        emu:clearKeys(0x3FF)  -- 0x3FF = all 10 GBA buttons
-        
-        -- Set new button state
-        if mask ~= 0 then
-            emu:addKeys(mask)
-        end
-        return "OK"
-    
-    elseif cmd == "TAP_BUTTON" then
-        -- Queue a button tap for a specific number of frames
-        -- Usage: TAP_BUTTON <button_mask> [frames]
-        -- Returns: "OK"
-        --
-        -- This is the RECOMMENDED command for button presses when using
-        -- fast-forward mode. The button will be held for the specified
-        -- number of frames regardless of emulator speed.
-        --
-        -- Args:
-        --   button_mask: Decimal button bitmask (see SET_INPUT for values)
-        --   frames: Number of frames to hold (default: 8, ~130ms at 60fps)
-        --
-        -- Example: TAP_BUTTON 1 8     (press A for 8 frames)
-        -- Example: TAP_BUTTON 64      (press UP for default 8 frames)
-        
-        local mask = tonumber(parts[2])
-        if not mask then
-            return "ERROR: Invalid mask. Usage: TAP_BUTTON <mask> [frames]"
+                frame, decode_button_mask(mask), mask_hex, mask))
         end
-        
-        local duration = tonumber(parts[3]) or 8  -- Default: 8 frames
-        
-        -- Clamp duration to reasonable range
-        if duration < 1 then duration = 1 end
-        if duration > 120 then duration = 120 end  -- Max ~2 seconds
-        
-        local button_names = decode_button_mask(mask)
+    end
+
+    -- Store the mask for use in FRAME_ADVANCE
+    current_key_mask = mask
+
+    -- Clear all buttons first
+    emu:clearKeys(0x3FF)  -- 0x3FF = all 10 GBA buttons
+
+    -- Set new button state
+    if mask ~= 0 then
+        emu:addKeys(mask)
+    end
+    return "OK"
+end
+
+handlers.TAP_BUTTON = function(parts)
+    -- Queue a button tap for a specific number of frames
+    -- Usage: TAP_BUTTON <button_mask> [frames]
+    -- Returns: "OK"
+    --
+    -- This is the RECOMMENDED command for button presses when using
+    -- fast-forward mode. The button will be held for the specified
+    -- number of frames regardless of emulator speed.
+    --
+    -- Args:
+    --   button_mask: Decimal button bitmask (see SET_INPUT for values)
+    --   frames: Number of frames to hold (default: 8, ~130ms at 60fps)
+    --
+    -- Example: TAP_BUTTON 1 8     (press A for 8 frames)
+    -- Example: TAP_BUTTON 64      (press UP for default 8 frames)
+
+    local mask = tonumber(parts[2])
+    if not mask then
+        return "ERROR: Invalid mask. Usage: TAP_BUTTON <mask> [frames]"
+    end
+
+    local duration = tonumber(parts[3]) or 8  -- Default: 8 frames
+
+    -- Clamp duration to reasonable range
+    if duration < 1 then duration = 1 end
+    if duration > 120 then duration = 120 end  -- Max ~2 seconds
+
+    if VERBOSE then
         console:log(string.format("[CMD #%d] TAP_BUTTON %s for %d frames (frame=%d)",
-            command_count, button_names, duration, frame_count))
-        
-        enqueueButton(mask, duration)
-        return "OK"
-    
-    elseif cmd == "HOLD_BUTTON" then
-        -- Queue a button hold for an exact number of frames
-        -- Usage: HOLD_BUTTON <button_mask> <frames>
-        -- Returns: "OK"
-        --
-        -- Similar to TAP_BUTTON but frames argument is required.
-        -- Use for walking (hold direction for N tiles worth of frames)
-        -- or for actions requiring specific hold durations.
-        --
-        -- Example: HOLD_BUTTON 64 30   (hold UP for 30 frames = ~0.5 sec)
-        
-        local mask = tonumber(parts[2])
-        local duration = tonumber(parts[3])
-        
-        if not mask or not duration then
-            return "ERROR: Usage: HOLD_BUTTON <mask> <frames>"
+            command_count, decode_button_mask(mask), duration, frame_count))
+    end
+
+    enqueueButton(mask, duration)
+    return "OK"
+end
+
+handlers.HOLD_BUTTON = function(parts)
+    -- Queue a button hold for an exact number of frames
+    -- Usage: HOLD_BUTTON <button_mask> <frames>
+    -- Returns: "OK"
+    --
+    -- Similar to TAP_BUTTON but frames argument is required.
+    -- Use for walking (hold direction for N tiles worth of frames)
+    -- or for actions requiring specific hold durations.
+    --
+    -- Example: HOLD_BUTTON 64 30   (hold UP for 30 frames = ~0.5 sec)
+
+    local mask = tonumber(parts[2])
+    local duration = tonumber(parts[3])
+
+    if not mask or not duration then
+        return "ERROR: Usage: HOLD_BUTTON <mask> <frames>"
+    end
+
+    -- Clamp duration to reasonable range
+    if duration < 1 then duration = 1 end
+    if duration > 600 then duration = 600 end  -- Max 10 seconds
+
+    if VERBOSE then
+        console:log(string.format("[CMD #%d] HOLD_BUTTON %s for %d frames (frame=%d)",
+            command_count, decode_button_mask(mask), duration, frame_count))
+    end
+
+    enqueueButton(mask, duration)
+    return "OK"
+end
+
+handlers.TAP_SEQUENCE = function(parts)
+    -- Queue a whole button sequence in one command
+    -- Usage: TAP_SEQUENCE <mask>:<frames>:<wait> [<mask>:<frames>:<wait> ...]
+    -- Returns: Total number of frames the sequence spans (decimal string)
+    --
+    -- Each step holds <mask> for <frames> frames, then leaves <wait> idle
+    -- frames before the next step starts. All steps are scheduled on the
+    -- frame-based key queue at once, so a menu navigation sequence costs a
+    -- single round-trip instead of one per button.
+    --
+    -- Example: TAP_SEQUENCE 1:8:30 1:8:30 2:8:60   (A, A, B with pauses)
+
+    if #parts < 2 then
+        return "ERROR: Usage: TAP_SEQUENCE <mask>:<frames>:<wait> ..."
+    end
+
+    -- Validate everything before queueing anything
+    local steps = {}
+    for i = 2, #parts do
+        local mask, duration, wait = string.match(parts[i], "^(%d+):(%d+):(%d+)$")
+        if not mask then
+            return "ERROR: Invalid step '" .. parts[i] .. "'. Expected <mask>:<frames>:<wait>"
         end
-        
-        -- Clamp duration to reasonable range
+        mask, duration, wait = tonumber(mask), tonumber(duration), tonumber(wait)
+        -- Same clamp as HOLD_BUTTON
         if duration < 1 then duration = 1 end
-        if duration > 600 then duration = 600 end  -- Max 10 seconds
-        
-        local button_names = decode_button_mask(mask)
-        console:log(string.format("[CMD #%d] HOLD_BUTTON %s for %d frames (frame=%d)",
-            command_count, button_names, duration, frame_count))
-        
-        enqueueButton(mask, duration)
+        if duration > 600 then duration = 600 end
+        steps[#steps + 1] = {mask, duration, wait}
+    end
+
+    -- A key held from frame S for <frames> is released on frame S + frames + 1.
+    -- The next step starts at least one frame after that release: pressing on
+    -- the release frame itself would clear and re-add the key in the same
+    -- updateKeyQueue pass, so a repeated button (A, A) would read as one hold.
+    local offset = 0
+    for _, step in ipairs(steps) do
+        enqueueButton(step[1], step[2], offset)
+        offset = offset + step[2] + 2 + step[3]
+    end
+
+    if VERBOSE then
+        console:log(string.format("[CMD #%d] TAP_SEQUENCE %d steps over %d frames (frame=%d)",
+            command_count, #steps, offset, frame_count))
+    end
+    return tostring(offset)
+end
+
+handlers.GET_FRAME = function(parts)
+    -- Get the current frame number
+    -- Usage: GET_FRAME
+    -- Returns: Current frame count as decimal string
+    --
+    -- Useful for:
+    --   - Synchronization between Python and Lua
+    --   - Debugging timing issues
+    --   - Verifying frame-based operations completed
+
+    return tostring(frame_count)
+end
+
+handlers.WAIT_FRAMES = function(parts)
+    -- Reply only after N more frames have run
+    -- Usage: WAIT_FRAMES <count>
+    -- Returns: "OK" once frame_count has advanced by <count>
+    --
+    -- The frame loop cannot block, so the reply is deferred and sent from the
+    -- frame callback. Commands received meanwhile are queued and handled after
+    -- the reply. Replaces polling GET_FRAME from Python: one round-trip total.
+
+    local count = tonumber(parts[2])
+    if not count or count < 0 then
+        return "ERROR: Usage: WAIT_FRAMES <count>"
+    end
+    if count == 0 then
         return "OK"
-    
-    elseif cmd == "GET_FRAME" then
-        -- Get the current frame number
-        -- Usage: GET_FRAME
-        -- Returns: Current frame count as decimal string
-        --
-        -- Useful for:
-        --   - Synchronization between Python and Lua
-        --   - Debugging timing issues
-        --   - Verifying frame-based operations completed
-        
-        return tostring(frame_count)
-    
-    elseif cmd == "CLEAR_KEY_QUEUE" then
-        -- Clear all pending key events from the queue
-        -- Usage: CLEAR_KEY_QUEUE
-        -- Returns: "OK"
-        --
-        -- Use this to cancel all pending button presses, e.g., when
-        -- changing states or recovering from errors.
-        
-        local count = #keyEventQueue
-        keyEventQueue = {}
-        emu:clearKeys(0x3FF)  -- Release all buttons
+    end
+    wait_until = frame_count + count
+    if VERBOSE then
+        console:log(string.format("[CMD #%d] WAIT_FRAMES %d (until frame=%d)",
+            command_count, count, wait_until))
+    end
+    return nil
+end
+
+handlers.CLEAR_KEY_QUEUE = function(parts)
+    -- Clear all pending key events from the queue
+    -- Usage: CLEAR_KEY_QUEUE
+    -- Returns: "OK"
+    --
+    -- Use this to cancel all pending button presses, e.g., when
+    -- changing states or recovering from errors.
+
+    local count = #keyEventQueue
+    keyEventQueue = {}
+    emu:clearKeys(0x3FF)  -- Release all buttons
+    if VERBOSE then
         console:log(string.format("[CMD #%d] CLEAR_KEY_QUEUE: Cleared %d events (frame=%d)",
             command_count, count, frame_count))
-        return "OK"
-        
-    elseif cmd == "RESET" then
-        -- Reset the emulator (soft reset)
-        -- Usage: RESET
-        -- Returns: "OK"
-        -- Note: This is equivalent to pressing the reset button, not a full restart
-        
-        local frame = get_frame_count()
-        console:log(string.format("[CMD #%d] RESET (frame=%d)", command_count, frame))
-        emu:reset()
-        return "OK"
-        
-    -- =========================================================================
-    -- RL AGENT COMMANDS (Event-Driven)
-    -- =========================================================================
-    -- These commands are optimized for RL training, providing quick access
-    -- to commonly-needed battle state information without reading large
-    -- memory blocks.
-    
-    elseif cmd == "IS_WAITING_INPUT" then
-        -- Check if the battle system is waiting for player input
-        -- Usage: IS_WAITING_INPUT
-        -- Returns: "YES" if waiting for input, "NO" if busy (animating, etc.)
-        --
-        -- This reads gBattleControllerExecFlags which is a bitfield tracking
-        -- which battle controllers are currently executing. When all controllers
-        -- are idle (value = 0), the game is waiting for the player's next action.
-        --
-        -- Use this to know when to:
-        --   1. Read the current battle state
-        --   2. Inject the next action
-        
-        local flags = emu:read32(ADDR_BATTLE_INPUT_WAIT)
-        local frame = get_frame_count()
-        local result = (flags == 0) and "YES" or "NO"
+    end
+    return "OK"
+end
+
+handlers.RESET = function(parts)
+    -- Reset the emulator (soft reset)
+    -- Usage: RESET
+    -- Returns: "OK"
+    -- Note: This is equivalent to pressing the reset button, not a full restart
+
+    local frame = get_frame_count()
+    console:log(string.format("[CMD #%d] RESET (frame=%d)", command_count, frame))
+    emu:reset()
+    return "OK"
+end
+
+handlers.SAVE_STATE = function(parts)
+    -- Snapshot the full emulator state into an in-memory slot
+    -- Usage: SAVE_STATE [name]
+    -- Returns: "OK"
+    --
+    -- Use this once a deterministic setup sequence (e.g., title screen to
+    -- the Factory draft) has finished, then LOAD_STATE to return to it
+    -- instead of replaying the inputs.
+    -- Example: SAVE_STATE draft
+
+    local name = parts[2] or "default"
+    local state = emu:saveStateBuffer()
+    if not state then
+        return "ERROR: Failed to save state"
+    end
+    saved_states[name] = state
+    if VERBOSE then
+        console:log(string.format("[CMD #%d] SAVE_STATE '%s' (%d bytes, frame=%d)",
+            command_count, name, #state, frame_count))
+    end
+    return "OK"
+end
+
+handlers.LOAD_STATE = function(parts)
+    -- Restore an in-memory slot written by SAVE_STATE
+    -- Usage: LOAD_STATE [name]
+    -- Returns: "OK", or an error if the slot was never saved
+    --
+    -- Pending queued key events are dropped, since they belong to the
+    -- timeline being discarded.
+
+    local name = parts[2] or "default"
+    local state = saved_states[name]
+    if not state then
+        return "ERROR: No saved state '" .. name .. "'"
+    end
+    keyEventQueue = {}
+    emu:clearKeys(0x3FF)
+    if not emu:loadStateBuffer(state) then
+        return "ERROR: Failed to load state '" .. name .. "'"
+    end
+    if VERBOSE then
+        console:log(string.format("[CMD #%d] LOAD_STATE '%s' (frame=%d)", command_count, name, frame_count))
+    end
+    return "OK"
+end
+
+-- =========================================================================
+-- RL AGENT COMMANDS (Event-Driven)
+-- =========================================================================
+-- These commands are optimized for RL training, providing quick access
+-- to commonly-needed battle state information without reading large
+-- memory blocks.
+
+handlers.IS_WAITING_INPUT = function(parts)
+    -- Check if the battle system is waiting for player input
+    -- Usage: IS_WAITING_INPUT
+    -- Returns: "YES" if waiting for input, "NO" if busy (animating, etc.)
+    --
+    -- This reads gBattleControllerExecFlags which is a bitfield tracking
+    -- which battle controllers are currently executing. When all controllers
+    -- are idle (value = 0), the game is waiting for the player's next action.
+    --
+    -- Use this to know when to:
+    --   1. Read the current battle state
+    --   2. Inject the next action
+
+    local flags = emu:read32(ADDR_BATTLE_INPUT_WAIT)
+    local result = (flags == 0) and "YES" or "NO"
+    if VERBOSE then
         console:log(string.format("[CMD #%d] IS_WAITING_INPUT -> %s (flags=0x%08X, frame=%d)", 
-            command_count, result, flags, frame))
-        return result
-        
-    elseif cmd == "GET_BATTLE_OUTCOME" then
-        -- Get the current battle outcome
-        -- Usage: GET_BATTLE_OUTCOME
-        -- Returns: Single digit string
-        --   "0" = Battle ongoing (no outcome yet)
-        --   "1" = Player won the battle
-        --   "2" = Player lost the battle
-        --   "3" = Battle ended in a draw
-        --   "4" = Player ran away from battle
-        --
-        -- Check this after IS_WAITING_INPUT returns NO to see if battle ended
-        
-        local outcome = emu:read8(ADDR_BATTLE_OUTCOME)
+            command_count, result, flags, get_frame_count()))
+    end
+    return result
+end
+
+handlers.GET_BATTLE_OUTCOME = function(parts)
+    -- Get the current battle outcome
+    -- Usage: GET_BATTLE_OUTCOME
+    -- Returns: Single digit string
+    --   "0" = Battle ongoing (no outcome yet)
+    --   "1" = Player won the battle
+    --   "2" = Player lost the battle
+    --   "3" = Battle ended in a draw
+    --   "4" = Player ran away from battle
+    --
+    -- Check this after IS_WAITING_INPUT returns NO to see if battle ended
+
+    local outcome = emu:read8(ADDR_BATTLE_OUTCOME)
+    if VERBOSE then
         local outcome_names = {"ONGOING", "WIN", "LOSS", "DRAW", "RAN"}
         local outcome_name = outcome_names[outcome + 1] or "UNKNOWN"
         local frame = get_frame_count()
         console:log(string.format("[CMD #%d] GET_BATTLE_OUTCOME -> %d (%s, frame=%d)", 
             command_count, outcome, outcome_name, frame))
-        return tostring(outcome)
-        
-    elseif cmd == "READ_LAST_MOVES" then
-        -- Read the most recently used move and who used it
-        -- Usage: READ_LAST_MOVES
-        -- Returns: "move_id,attacker_slot" (comma-separated)
-        --   move_id: The ID of the move (0-354)
-        --   attacker_slot: Who used it (0=Player1, 1=Enemy1, 2=Player2, 3=Enemy2)
-        --
-        -- Example response: "89,1" means Enemy used move #89 (Earthquake)
-        --
-        -- Use this to:
-        --   1. Track what moves the enemy has revealed
-        --   2. Verify your action was executed correctly
-        --   3. Build battle history for the LSTM model
-        
-        local move_id = emu:read16(ADDR_LAST_USED_MOVE)
-        local attacker = emu:read8(ADDR_BATTLER_ATTACKER)
+    end
+    return tostring(outcome)
+end
+
+handlers.READ_LAST_MOVES = function(parts)
+    -- Read the most recently used move and who used it
+    -- Usage: READ_LAST_MOVES
+    -- Returns: "move_id,attacker_slot" (comma-separated)
+    --   move_id: The ID of the move (0-354)
+    --   attacker_slot: Who used it (0=Player1, 1=Enemy1, 2=Player2, 3=Enemy2)
+    --
+    -- Example response: "89,1" means Enemy used move #89 (Earthquake)
+    --
+    -- Use this to:
+    --   1. Track what moves the enemy has revealed
+    --   2. Verify your action was executed correctly
+    --   3. Build battle history for the LSTM model
+
+    local move_id = emu:read16(ADDR_LAST_USED_MOVE)
+    local attacker = emu:read8(ADDR_BATTLER_ATTACKER)
+    if VERBOSE then
         local frame = get_frame_count()
         local attacker_names = {"Player1", "Enemy1", "Player2", "Enemy2"}
         local attacker_name = attacker_names[attacker + 1] or "Unknown"
         console:log(string.format("[CMD #%d] READ_LAST_MOVES -> move_id=%d, attacker=%d (%s, frame=%d)", 
             command_count, move_id, attacker, attacker_name, frame))
-        return tostring(move_id) .. "," .. tostring(attacker)
-        
-    elseif cmd == "READ_RNG" then
-        -- Read the current PRNG (Pseudo-Random Number Generator) state
-        -- Usage: READ_RNG
-        -- Returns: Decimal value of the 32-bit RNG state
-        --
-        -- Pokemon Emerald uses a Linear Congruential Generator (LCG):
-        --   next = (current * 0x41C64E6D + 0x6073) & 0xFFFFFFFF
-        --
-        -- This is useful for:
-        --   1. Debugging randomness-related issues
-        --   2. RNG manipulation research
-        --   3. Verifying determinism in test scenarios
-        
-        local rng = emu:read32(ADDR_RNG_VALUE)
+    end
+    return tostring(move_id) .. "," .. tostring(attacker)
+end
+
+handlers.READ_RNG = function(parts)
+    -- Read the current PRNG (Pseudo-Random Number Generator) state
+    -- Usage: READ_RNG
+    -- Returns: Decimal value of the 32-bit RNG state
+    --
+    -- Pokemon Emerald uses a Linear Congruential Generator (LCG):
+    --   next = (current * 0x41C64E6D + 0x6073) & 0xFFFFFFFF
+    --
+    -- This is useful for:
+    --   1. Debugging randomness-related issues
+    --   2. RNG manipulation research
+    --   3. Verifying determinism in test scenarios
+
+    local rng = emu:read32(ADDR_RNG_VALUE)
+    if VERBOSE then
         local frame = get_frame_count()
         console:log(string.format("[CMD #%d] READ_RNG -> 0x%08X (decimal=%u, frame=%d)", 
             command_count, rng, rng, frame))
-        return tostring(rng)
-        
-    elseif cmd == "HELP" then
-        -- Display available commands
-        return "Commands: PING, READ_BLOCK, READ_U16, READ_U32, READ_PTR, READ_PTR_U16, WRITE_BYTE, SET_INPUT, TAP_BUTTON, HOLD_BUTTON, GET_FRAME, CLEAR_KEY_QUEUE, FRAME_ADVANCE, RESET, IS_WAITING_INPUT, GET_BATTLE_OUTCOME, READ_LAST_MOVES, READ_RNG"
-        
-    else
+    end
+    return tostring(rng)
+end
+
+handlers.VERBOSE = function(parts)
+    -- Toggle per-command debug logging
+    -- Usage: VERBOSE <0|1>
+    -- Returns: "OK"
+
+    local flag = tonumber(parts[2])
+    if not flag then
+        return "ERROR: Usage: VERBOSE <0|1>"
+    end
+    VERBOSE = flag ~= 0
+    console:log(string.format("[CMD #%d] VERBOSE %s", command_count, VERBOSE and "on" or "off"))
+    return "OK"
+end
+
+handlers.HELP = function(parts)
+    -- Display available commands
+    return "Commands: PING, READ_BLOCK, READ_U16, READ_U32, READ_PTR, READ_PTR_U16, WRITE_BYTE, SET_INPUT, TAP_BUTTON, HOLD_BUTTON, TAP_SEQUENCE, WAIT_FRAMES, GET_FRAME, CLEAR_KEY_QUEUE, FRAME_ADVANCE, RESET, SAVE_STATE, LOAD_STATE, IS_WAITING_INPUT, GET_BATTLE_OUTCOME, READ_LAST_MOVES, READ_RNG, VERBOSE"
+end
+
+--[[
+    Process a single command and return the response string.
+    
+    This is the main dispatch function that routes commands to their handlers
+    through the `handlers` table.
+    All commands return a single-line string response.
+    
+    @param line: The command string to process
+    @return: Response string to send back to client, or nil if the reply is
+             deferred (WAIT_FRAMES)
+--]]
+function handleCommand(line)
+    local parts = parseCommand(line)
+    local cmd = parts[1]
+    
+    -- Increment command counter
+    command_count = command_count + 1
+    
+    -- Single table lookup instead of walking a chain of string comparisons
+    local handler = handlers[cmd]
+    if not handler then
         return "ERROR: Unknown command '" .. tostring(cmd) .. "'. Send HELP for command list."
     end
+    return handler(parts)
 end
 
 -- =============================================================================
 -- SOCKET EVENT HANDLERS
 -- =============================================================================
 
+--[[
+    Send one response line to the client, logging errors and long replies.
+--]]
+local function sendResponse(response)
+    client:send(response .. "\n")
+
+    -- Log response for debugging (truncate long responses)
+    -- Note: Command details are logged inside handleCommand()
+    -- Errors are always logged; long responses only when VERBOSE
+    if string.find(response, "ERROR") then
+        console:log(string.format("[RESPONSE] ❌ %s", response))
+    elseif VERBOSE and #response > 100 then
+        console:log(string.format("[RESPONSE] %s... (%d bytes)", string.sub(response, 1, 50), #response))
+    end
+end
+
+--[[
+    Handle queued commands in arrival order until the queue is empty or a
+    command defers its reply (WAIT_FRAMES).
+--]]
+local function runCommandQueue()
+    while not wait_until and #command_queue > 0 do
+        local response = handleCommand(table.remove(command_queue, 1))
+        if response then
+            sendResponse(response)
+        end
+    end
+end
+
 --[[
     Handle new client connections.
     
@@ -739,43 +995,49 @@ server:add("received", function()
         client = server:accept()
         if client then
             local frame = get_frame_count()
-            console:log("================================================================================")
-            console:log(string.format("✅ CLIENT CONNECTED from Python backend (frame=%d)", frame))
-            console:log("================================================================================")
+            -- One console call per event: each log line is a separate UI update in mGBA
+            console:log(string.format("%s\n✅ CLIENT CONNECTED from Python backend (frame=%d)\n%s",
+                RULE, frame, RULE))
             command_count = 0  -- Reset counter on new connection
+            rx_pending = ""
+            wait_until = nil
+            command_queue = {}
             frame_count = 0    -- Reset frame counter on new connection
             
             -- Set up data receive handler for this client
             client:add("received", function()
                 local data = client:receive(1024)
                 if data then
-                    -- Process each line (command) in the received data
-                    -- Commands are newline-separated
-                    for line in string.gmatch(data, "[^\r\n]+") do
-                        -- Process command and send response
-                        local response = handleCommand(line)
-                        client:send(response .. "\n")
-                        
-                        -- Log response for debugging (truncate long responses)
-                        -- Note: Command details are logged inside handleCommand()
-                        -- Only log errors or very long responses to avoid spam
-                        if string.find(response, "ERROR") then
-                            console:log(string.format("[RESPONSE] ❌ %s", response))
-                        elseif #response > 100 then
-                            console:log(string.format("[RESPONSE] %s... (%d bytes)", string.sub(response, 1, 50), #response))
+                    -- Process each complete line (command) in the received data.
+                    -- Commands are newline-separated; a pipelined batch can end
+                    -- mid-command, so the unterminated tail waits for the next read.
+                    data = rx_pending .. data
+                    local last_nl = 0
+                    for i = #data, 1, -1 do
+                        if string.byte(data, i) == 10 then
+                            last_nl = i
+                            break
                         end
                     end
+                    rx_pending = string.sub(data, last_nl + 1)
+                    data = string.sub(data, 1, last_nl)
+                    for line in string.gmatch(data, "[^\r\n]+") do
+                        command_queue[#command_queue + 1] = line
+                    end
+                    runCommandQueue()
                 end
             end)
             
             -- Handle client disconnect
             client:add("error", function()
                 local frame = get_frame_count()
-                console:log("================================================================================")
-                console:log(string.format("❌ CLIENT DISCONNECTED (frame=%d, total commands=%d)", frame, command_count))
-                console:log("================================================================================")
+                console:log(string.format("%s\n❌ CLIENT DISCONNECTED (frame=%d, total commands=%d)\n%s",
+                    RULE, frame, command_count, RULE))
                 client = nil
                 command_count = 0
+                rx_pending = ""
+                wait_until = nil
+                command_queue = {}
                 frame_count = 0
             end)
         end
@@ -801,6 +1063,15 @@ callbacks:add("frame", function()
     
     -- Process key event queue (frame-based button handling)
     updateKeyQueue()
+
+    -- Release a finished WAIT_FRAMES, then any commands queued behind it
+    if wait_until and frame_count >= wait_until then
+        wait_until = nil
+        if client then
+            sendResponse("OK")
+            runCommandQueue()
+        end
+    end
     
     -- Poll server for new connection attempts
     server:poll()
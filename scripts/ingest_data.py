@@ -1,7 +1,13 @@
+import argparse
+import functools
 import re
 import sqlite3
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+
+from seed_facility_mons import BFM_DENORM_SQL
 
 """
 Data Ingestion Script for Pokémon Battle Factory Knowledge Base.
@@ -17,33 +23,24 @@ It handles:
 
 Usage:
     python3 scripts/ingest_data.py
+    python3 scripts/ingest_data.py --tables moves,items   # re-ingest only these tables
+    python3 scripts/ingest_data.py --jobs 3              # parse/load the tables in parallel
 """
 
 # Constants
 DB_PATH = "src/data/knowledge_base.db"
 RAW_DATA_PATH = "data/raw"
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER on older builds
+SQLITE_MAX_VARIABLES = 999
 
-def setup_database(conn: sqlite3.Connection) -> None:
-    """Initializes the SQLite database schema.
-
-    Drops existing tables and recreates them with proper constraints/Foreign Keys.
+# Insert column order for each table; row tuples are built in the same order
+MOVE_COLUMNS = ("id", "identifier", "name", "type", "power", "accuracy", "pp", "effect",
+                "target", "priority", "flags", "secondary_effect_chance", "split")
+SPECIES_COLUMNS = ("id", "identifier", "name", "type1", "type2", "base_hp", "base_atk", "base_def",
+                   "base_sp_atk", "base_sp_def", "base_speed", "ability1", "ability2")
+ITEM_COLUMNS = ("id", "identifier", "name", "description", "hold_effect", "hold_effect_param", "price")
 
-    Args:
-        conn (sqlite3.Connection): Active database connection.
-    """
-    cursor = conn.cursor()
-    
-    # Enable foreign keys
-    cursor.execute("PRAGMA foreign_keys = ON;")
-
-    # Drop existing tables to ensure fresh schema
-    cursor.execute("DROP TABLE IF EXISTS battle_frontier_mons;")
-    cursor.execute("DROP TABLE IF EXISTS moves;")
-    cursor.execute("DROP TABLE IF EXISTS species;")
-    cursor.execute("DROP TABLE IF EXISTS items;")
-
-    # Create Tables
-    cursor.execute("""
+SPECIES_SCHEMA = """
     CREATE TABLE IF NOT EXISTS species (
         id INTEGER PRIMARY KEY,
         identifier TEXT NOT NULL,
@@ -57,11 +54,10 @@ def setup_database(conn: sqlite3.Connection) -> None:
         base_sp_def INTEGER NOT NULL,
         base_speed INTEGER NOT NULL,
         ability1 TEXT,
-        ability2 TEXT,
-        UNIQUE(identifier)
-    );""")
+        ability2 TEXT
+    );"""
 
-    cursor.execute("""
+MOVES_SCHEMA = """
     CREATE TABLE IF NOT EXISTS moves (
         id INTEGER PRIMARY KEY,
         identifier TEXT NOT NULL,
@@ -75,11 +71,10 @@ def setup_database(conn: sqlite3.Connection) -> None:
         priority INTEGER,
         flags TEXT,
         secondary_effect_chance INTEGER,
-        split TEXT,
-        UNIQUE(identifier)
-    );""")
+        split TEXT
+    );"""
 
-    cursor.execute("""
+ITEMS_SCHEMA = """
     CREATE TABLE IF NOT EXISTS items (
         id INTEGER PRIMARY KEY,
         identifier TEXT NOT NULL,
@@ -87,12 +82,10 @@ def setup_database(conn: sqlite3.Connection) -> None:
         description TEXT,
         hold_effect TEXT,
         hold_effect_param INTEGER,
-        price INTEGER,
-        UNIQUE(identifier)
-    );""")
-    
-    # Re-create battle_frontier_mons as it depends on others
-    cursor.execute("""
+        price INTEGER
+    );"""
+
+BFM_SCHEMA = """
     CREATE TABLE IF NOT EXISTS battle_frontier_mons (
         id INTEGER PRIMARY KEY,
         species_id INTEGER NOT NULL,
@@ -109,58 +102,173 @@ def setup_database(conn: sqlite3.Connection) -> None:
         FOREIGN KEY(move3_id) REFERENCES moves(id),
         FOREIGN KEY(move4_id) REFERENCES moves(id),
         FOREIGN KEY(item_id) REFERENCES items(id)
-    );""")
+    );"""
+
+# Identifier -> display name, e.g. MOVE_DOUBLE_EDGE -> "Double Edge"
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+# Gen 3 decides the physical/special split by move type
+_SPECIAL_TYPES = frozenset({
+    "TYPE_FIRE", "TYPE_WATER", "TYPE_GRASS", "TYPE_ELECTRIC",
+    "TYPE_ICE", "TYPE_PSYCHIC", "TYPE_DRAGON", "TYPE_DARK",
+})
+
+# Indexes are built after each table's bulk load rather than maintained row by
+# row during it. The NOCASE species name index serves inspect_db's (case-insensitive)
+# LIKE searches when the pattern has no leading wildcard.
+TABLE_INDEXES = {
+    "species": (
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_species_identifier ON species(identifier)",
+        "CREATE INDEX IF NOT EXISTS idx_species_name ON species(name COLLATE NOCASE)",
+    ),
+    "moves": ("CREATE UNIQUE INDEX IF NOT EXISTS idx_moves_identifier ON moves(identifier)",),
+    "items": ("CREATE UNIQUE INDEX IF NOT EXISTS idx_items_identifier ON items(identifier)",),
+}
+
+TABLE_SCHEMAS = {
+    "species": SPECIES_SCHEMA,
+    "moves": MOVES_SCHEMA,
+    "items": ITEMS_SCHEMA,
+}
+
+# Full reset: battle_frontier_mons (and its denormalized copy built by
+# seed_facility_mons.py) depends on the others, so it is dropped first
+SCHEMA_SQL = (
+    "PRAGMA foreign_keys = ON;"
+    "DROP TABLE IF EXISTS bfm_denorm;"
+    "DROP TABLE IF EXISTS battle_frontier_mons;"
+    "DROP TABLE IF EXISTS moves;"
+    "DROP TABLE IF EXISTS species;"
+    "DROP TABLE IF EXISTS items;"
+    + SPECIES_SCHEMA + MOVES_SCHEMA + ITEMS_SCHEMA + BFM_SCHEMA
+)
+
+# Compiled once; the ingest loops run these thousands of times
+# Braced values (`.types = {TYPE_A, TYPE_B},`) are captured whole
+_FIELD_RE = re.compile(r'\.(\w+)\s*=\s*(\{[^}]*\}|[^,}]+?)\s*,')
+_COMMENT_RE = re.compile(r'//.*')
+# Scanned over the whole header text, anchored at line starts
+_DEFINE_ANY = re.compile(r'^#define[ \t]+(\w+)[ \t]+(0x[0-9A-Fa-f]+|\d+)', re.MULTILINE)
+# Only the `[PREFIX_X] = {` opener is matched; iter_structs finds the closing brace
+_MOVE_HEADER_RE = re.compile(r'\[(MOVE_\w+)\]\s*=\s*\{')
+_SPECIES_HEADER_RE = re.compile(r'\[(SPECIES_\w+)\]\s*=\s*\{')
+_ITEM_HEADER_RE = re.compile(r'\[(ITEM_\w+)\]\s*=\s*\{')
+_BRACE_RE = re.compile(r'[{}]')
+_TYPE_TOKEN_RE = re.compile(r'TYPE_\w+')
+_ABILITY_TOKEN_RE = re.compile(r'ABILITY_\w+')
+_ITEM_NAME_RE = re.compile(r'\.name\s*=\s*_\("([^"]+)"\)')
+
+def setup_database(conn: sqlite3.Connection, tables=None) -> None:
+    """Initializes the SQLite database schema.
+
+    Drops existing tables and recreates them with proper constraints/Foreign Keys.
+    The whole DDL goes through a single ``executescript`` call.
 
-    conn.commit()
+    Args:
+        conn (sqlite3.Connection): Active database connection.
+        tables (list, optional): Incremental mode. Only ensures these core tables
+            exist without dropping anything; their rows are then upserted in place,
+            so `battle_frontier_mons` and the extra rows from `seed_items.py` survive.
+            Defaults to a full reset.
+    """
+    if tables is None:
+        conn.executescript(SCHEMA_SQL)
+    else:
+        conn.executescript("".join(TABLE_SCHEMAS[table] for table in tables))
     print("Database schema initialized.")
 
-def parse_value(line: str, key: str) -> str:
-    """Helper to extract value after = in a struct definition line."""
-    match = re.search(fr"\.{key}\s*=\s*([^,]+),", line)
-    if match:
-        val = match.group(1).strip()
-        # Remove comments if any
-        val = re.sub(r'//.*', '', val).strip()
-        return val
-    return None
+def bulk_insert(conn: sqlite3.Connection, table: str, cols: tuple, rows) -> int:
+    """Inserts rows with multi-row ``VALUES`` statements.
+
+    Rows are grouped so each statement binds at most ``SQLITE_MAX_VARIABLES``
+    parameters, which turns one statement per row into one per chunk.
+
+    Args:
+        conn (sqlite3.Connection): Connection to execute on (inside the caller's transaction).
+        table (str): Target table name.
+        cols (tuple): Column names, in the order of each row tuple.
+        rows: Iterable of row tuples.
+
+    Returns:
+        int: Number of rows inserted.
+    """
+    chunk = SQLITE_MAX_VARIABLES // len(cols)
+    placeholders = "(" + ",".join("?" * len(cols)) + ")"
+    prefix = f"INSERT OR REPLACE INTO {table} ({', '.join(cols)}) VALUES "
+    # Statement text only depends on the chunk length, so the full-size one is reused
+    full_sql = prefix + ",".join([placeholders] * chunk)
+
+    it = iter(rows)
+    total = 0
+    while True:
+        chunk_rows = list(islice(it, chunk))
+        if not chunk_rows:
+            break
+        n = len(chunk_rows)
+        sql = full_sql if n == chunk else prefix + ",".join([placeholders] * n)
+        conn.execute(sql, list(chain.from_iterable(chunk_rows)))
+        total += n
+    return total
+
+def parse_fields(body: str) -> dict:
+    """Extracts every `.field = value,` pair of a struct body in one scan.
+
+    Trailing `//` comments are stripped from the values.
+
+    Args:
+        body (str): Text between the braces of a struct initializer.
+
+    Returns:
+        dict: Field name to raw value string.
+    """
+    return {m.group(1): _COMMENT_RE.sub('', m.group(2)).strip() for m in _FIELD_RE.finditer(body)}
 
 
 def parse_constants(filename: str) -> dict:
     """Parses a C header file for #define CONSTANT_NAME ID mappings."""
     filepath = os.path.join(RAW_DATA_PATH, filename)
-    mapping = {}
     with open(filepath, 'r') as f:
-        for line in f:
-            # #define MOVE_POUND 1
-            match = re.match(r'#define\s+(\w+)\s+(\d+)', line)
-            if match:
-                key, val = match.groups()
-                mapping[key] = int(val)
-            # Handle hex? #define FLAG 0x1
-            match_hex = re.match(r'#define\s+(\w+)\s+(0x[0-9A-Fa-f]+)', line)
-            if match_hex:
-                 key, val = match_hex.groups()
-                 mapping[key] = int(val, 16)
+        text = f.read()
+
+    # #define MOVE_POUND 1 / #define FLAG 0x1 (hex is tried first in the alternation)
+    mapping = {}
+    for key, val in _DEFINE_ANY.findall(text):
+        # Not int(val, 0): that rejects zero-padded decimals like 010
+        mapping[key] = int(val, 16) if val.startswith("0x") else int(val)
     return mapping
 
-def ingest_moves(conn: sqlite3.Connection) -> None:
-    """Reads `battle_moves.h` and populates the `moves` table."""
-    print("Ingesting Moves...")
-    cursor = conn.cursor()
-    
-    # 1. Load Constants
-    move_ids = parse_constants("moves_constants.h")
-    
-    filepath = os.path.join(RAW_DATA_PATH, "battle_moves.h")
-    with open(filepath, 'r') as f:
-        content = f.read()
+def iter_structs(content: str, header_re: re.Pattern):
+    """Yields `(identifier, body)` for each `[IDENTIFIER] = { ... }` initializer.
 
-    pattern = re.compile(r'\[(MOVE_\w+)\]\s*=\s*\{(.*?)\},', re.DOTALL)
-    
-    moves_processed = 0
-    for match in pattern.finditer(content):
-        identifier = match.group(1)
-        body = match.group(2)
+    The body is found by tracking brace depth, so nested initializers such as
+    `.types = { TYPE_A, TYPE_B },` stay inside it, and the text is scanned once.
+
+    Args:
+        content (str): Full header text.
+        header_re (re.Pattern): Opener pattern capturing the identifier.
+
+    Yields:
+        tuple: Identifier and the text between the outer braces.
+    """
+    pos = 0
+    while True:
+        header = header_re.search(content, pos)
+        if header is None:
+            return
+        start = header.end()
+        depth = 1
+        for brace in _BRACE_RE.finditer(content, start):
+            depth += 1 if brace.group() == '{' else -1
+            if depth == 0:
+                break
+        else:
+            return  # Unterminated initializer at EOF
+        yield header.group(1), content[start:brace.start()]
+        pos = brace.end()
+
+def iter_move_rows(content: str, move_ids: dict):
+    """Yields `moves` row tuples (in MOVE_COLUMNS order) parsed from `battle_moves.h` text."""
+    for identifier, body in iter_structs(content, _MOVE_HEADER_RE):
         
         move_id = move_ids.get(identifier)
         if move_id is None:
@@ -170,191 +278,244 @@ def ingest_moves(conn: sqlite3.Connection) -> None:
                 print(f"Warning: ID not found for {identifier}")
                 continue
 
-        # Defaults
-        name = identifier.replace("MOVE_", "").replace("_", " ").title()
-        power = 0
-        accuracy = 0
-        pp = 0
-        effect = ""
-        target = "MOVE_TARGET_SELECTED"
-        priority = 0
-        flags = ""
-        sec_chance = 0
-        move_type = "TYPE_NORMAL"
-        
-        # Parse fields
-        for line in body.split('\n'):
-            line = line.strip()
-            if not line: continue
-            
-            if line.startswith('.power'):
-                power = int(parse_value(line, 'power') or 0)
-            elif line.startswith('.accuracy'):
-                accuracy = int(parse_value(line, 'accuracy') or 0)
-            elif line.startswith('.pp'):
-                pp = int(parse_value(line, 'pp') or 0)
-            elif line.startswith('.effect'):
-                effect = parse_value(line, 'effect')
-            elif line.startswith('.target'):
-                target = parse_value(line, 'target')
-            elif line.startswith('.priority'):
-                priority = int(parse_value(line, 'priority') or 0)
-            elif line.startswith('.secondaryEffectChance'):
-                sec_chance = int(parse_value(line, 'secondaryEffectChance') or 0)
-            elif line.startswith('.type'):
-                move_type = parse_value(line, 'type')
-            elif line.startswith('.flags'):
-                flags_val = parse_value(line, 'flags')
-                if flags_val:
-                    flags = flags_val
-        
+        name = identifier.removeprefix("MOVE_").translate(_UNDERSCORE_TO_SPACE).title()
+        fields = parse_fields(body)
+        power = int(fields.get('power') or 0)
+        accuracy = int(fields.get('accuracy') or 0)
+        pp = int(fields.get('pp') or 0)
+        effect = fields.get('effect', "")
+        target = fields.get('target', "MOVE_TARGET_SELECTED")
+        priority = int(fields.get('priority') or 0)
+        flags = fields.get('flags') or ""
+        sec_chance = int(fields.get('secondaryEffectChance') or 0)
+        move_type = fields.get('type', "TYPE_NORMAL")
+
         # Determine Split (Physical/Special) based on Type for Gen 3
-        special_types = [
-            "TYPE_FIRE", "TYPE_WATER", "TYPE_GRASS", "TYPE_ELECTRIC", 
-            "TYPE_ICE", "TYPE_PSYCHIC", "TYPE_DRAGON", "TYPE_DARK"
-        ]
-        split = "Special" if move_type in special_types else "Physical"
+        split = "Special" if move_type in _SPECIAL_TYPES else "Physical"
         if move_type == "TYPE_MYSTERY": split = "Physical"
         
         clean_type = move_type.replace("TYPE_", "").title()
 
-        cursor.execute("""
-            INSERT OR REPLACE INTO moves 
-            (id, identifier, name, type, power, accuracy, pp, effect, target, priority, flags, secondary_effect_chance, split)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (move_id, identifier, name, clean_type, power, accuracy, pp, effect, target, priority, flags, sec_chance, split))
-        moves_processed += 1
+        yield (move_id, identifier, name, clean_type, power, accuracy, pp, effect, target, priority, flags, sec_chance, split)
 
-    conn.commit()
-    print(f"Processed {moves_processed} moves.")
-
-def ingest_species(conn: sqlite3.Connection) -> None:
-    """Reads `species_info.h` and populates the `species` table."""
-    print("Ingesting Species...")
-    cursor = conn.cursor()
+def ingest_moves(conn: sqlite3.Connection, buffered: bool = False) -> int:
+    """Reads `battle_moves.h` and populates the `moves` table. Returns the row count."""
+    print("Ingesting Moves...")
     
-    species_ids = parse_constants("species_constants.h")
+    # 1. Load Constants
+    move_ids = parse_constants("moves_constants.h")
     
-    filepath = os.path.join(RAW_DATA_PATH, "species_info.h")
+    filepath = os.path.join(RAW_DATA_PATH, "battle_moves.h")
     with open(filepath, 'r') as f:
         content = f.read()
 
-    pattern = re.compile(r'\[(SPECIES_\w+)\]\s*=\s*\{(.*?)\},', re.DOTALL)
-    
-    species_processed = 0
-    for match in pattern.finditer(content):
-        identifier = match.group(1)
-        body = match.group(2)
+    # Rows stream straight from the parser into the multi-row inserts, in one
+    # explicit transaction committed once below. Buffered (--jobs workers): parse
+    # everything first so the write lock is held only for the inserts.
+    rows = iter_move_rows(content, move_ids)
+    if buffered:
+        rows = list(rows)
+    conn.execute("BEGIN IMMEDIATE")
+    count = bulk_insert(conn, "moves", MOVE_COLUMNS, rows)
+    conn.execute("COMMIT")
+    print(f"Processed {count} moves.")
+    return count
+
+def iter_species_rows(content: str, species_ids: dict):
+    """Yields `species` row tuples (in SPECIES_COLUMNS order) parsed from `species_info.h` text."""
+    for identifier, body in iter_structs(content, _SPECIES_HEADER_RE):
         
         species_id = species_ids.get(identifier)
         if species_id is None:
             if identifier == "SPECIES_NONE": species_id = 0
             else: continue
 
-        name = identifier.replace("SPECIES_", "").replace("_", " ").title()
-        hp = atk = defense = sp_atk = sp_def = speed = 0
+        name = identifier.removeprefix("SPECIES_").translate(_UNDERSCORE_TO_SPACE).title()
         type1 = type2 = "TYPE_NORMAL"
         ability1 = ability2 = "ABILITY_NONE"
         
-        # Parse
-        types_match = re.search(r'\.types\s*=\s*\{\s*(TYPE_\w+)\s*,\s*(TYPE_\w+)\s*\}', body)
-        if types_match:
-            type1 = types_match.group(1)
-            type2 = types_match.group(2)
-        
-        abilities_match = re.search(r'\.abilities\s*=\s*\{\s*(ABILITY_\w+)\s*,\s*(ABILITY_\w+)\s*\}', body)
-        if abilities_match:
-            ability1 = abilities_match.group(1)
-            ability2 = abilities_match.group(2)
-
-        for line in body.split('\n'):
-            line = line.strip()
-            if '.baseHP' in line: hp = int(parse_value(line, 'baseHP') or 0)
-            if '.baseAttack' in line: atk = int(parse_value(line, 'baseAttack') or 0)
-            if '.baseDefense' in line: defense = int(parse_value(line, 'baseDefense') or 0)
-            if '.baseSpeed' in line: speed = int(parse_value(line, 'baseSpeed') or 0)
-            if '.baseSpAttack' in line: sp_atk = int(parse_value(line, 'baseSpAttack') or 0)
-            if '.baseSpDefense' in line: sp_def = int(parse_value(line, 'baseSpDefense') or 0)
+        fields = parse_fields(body)
+        types = _TYPE_TOKEN_RE.findall(fields.get('types', ""))
+        if len(types) == 2:
+            type1, type2 = types
+        abilities = _ABILITY_TOKEN_RE.findall(fields.get('abilities', ""))
+        if len(abilities) == 2:
+            ability1, ability2 = abilities
+        hp = int(fields.get('baseHP') or 0)
+        atk = int(fields.get('baseAttack') or 0)
+        defense = int(fields.get('baseDefense') or 0)
+        speed = int(fields.get('baseSpeed') or 0)
+        sp_atk = int(fields.get('baseSpAttack') or 0)
+        sp_def = int(fields.get('baseSpDefense') or 0)
 
         clean_t1 = type1.replace("TYPE_", "").title()
         clean_t2 = type2.replace("TYPE_", "").title()
         
-        cursor.execute("""
-            INSERT OR REPLACE INTO species
-            (id, identifier, name, type1, type2, base_hp, base_atk, base_def, base_sp_atk, base_sp_def, base_speed, ability1, ability2)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (species_id, identifier, name, clean_t1, clean_t2, hp, atk, defense, sp_atk, sp_def, speed, ability1, ability2))
-        species_processed += 1
-
-    conn.commit()
-    print(f"Processed {species_processed} species.")
-
-def ingest_items(conn: sqlite3.Connection) -> None:
-    """Reads `items.h` and populates the `items` table."""
-    print("Ingesting Items...")
-    cursor = conn.cursor()
+        yield (species_id, identifier, name, clean_t1, clean_t2, hp, atk, defense, sp_atk, sp_def, speed, ability1, ability2)
+
+def ingest_species(conn: sqlite3.Connection, buffered: bool = False) -> int:
+    """Reads `species_info.h` and populates the `species` table. Returns the row count."""
+    print("Ingesting Species...")
     
-    item_ids = parse_constants("item_constants.h")
+    species_ids = parse_constants("species_constants.h")
     
-    filepath = os.path.join(RAW_DATA_PATH, "items.h")
+    filepath = os.path.join(RAW_DATA_PATH, "species_info.h")
     with open(filepath, 'r') as f:
         content = f.read()
 
-    pattern = re.compile(r'\[(ITEM_\w+)\]\s*=\s*\{(.*?)\},', re.DOTALL)
-    
-    items_processed = 0
-    for match in pattern.finditer(content):
-        identifier = match.group(1)
-        body = match.group(2)
+    # Rows stream straight from the parser into the multi-row inserts, in one
+    # explicit transaction committed once below. Buffered (--jobs workers): parse
+    # everything first so the write lock is held only for the inserts.
+    rows = iter_species_rows(content, species_ids)
+    if buffered:
+        rows = list(rows)
+    conn.execute("BEGIN IMMEDIATE")
+    count = bulk_insert(conn, "species", SPECIES_COLUMNS, rows)
+    conn.execute("COMMIT")
+    print(f"Processed {count} species.")
+    return count
+
+def iter_item_rows(content: str, item_ids: dict):
+    """Yields `items` row tuples (in ITEM_COLUMNS order) parsed from `items.h` text."""
+    for identifier, body in iter_structs(content, _ITEM_HEADER_RE):
         
         item_id = item_ids.get(identifier)
         if item_id is None:
              if identifier == "ITEM_NONE": item_id = 0
              else: continue # Skip if no ID found (might be special or alias)
         
-        name = identifier.replace("ITEM_", "").replace("_", " ").title()
+        name = identifier.removeprefix("ITEM_").translate(_UNDERSCORE_TO_SPACE).title()
         desc = ""
-        hold_effect = ""
-        hold_param = 0
-        price = 0
+        fields = parse_fields(body)
+        m = _ITEM_NAME_RE.search(body)
+        if m: name = m.group(1)
+        price = int(fields.get('price') or 0)
+        hold_effect = fields.get('holdEffect', "")
+        hold_param = int(fields.get('holdEffectParam') or 0)
         
-        for line in body.split('\n'):
-            line = line.strip()
-            if '.name' in line: 
-                m = re.search(r'\.name\s*=\s*_\("([^"]+)"\)', line)
-                if m: name = m.group(1)
-            if '.price' in line: price = int(parse_value(line, 'price') or 0)
-            if '.holdEffect' in line and 'holdEffectParam' not in line: 
-                 hold_effect = parse_value(line, 'holdEffect')
-            if '.holdEffectParam' in line:
-                 hold_param = int(parse_value(line, 'holdEffectParam') or 0)
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO items
-            (id, identifier, name, description, hold_effect, hold_effect_param, price)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (item_id, identifier, name, desc, hold_effect, hold_param, price))
-        items_processed += 1
+        yield (item_id, identifier, name, desc, hold_effect, hold_param, price)
+
+def ingest_items(conn: sqlite3.Connection, buffered: bool = False) -> int:
+    """Reads `items.h` and populates the `items` table. Returns the row count."""
+    print("Ingesting Items...")
+    
+    item_ids = parse_constants("item_constants.h")
+    
+    filepath = os.path.join(RAW_DATA_PATH, "items.h")
+    with open(filepath, 'r') as f:
+        content = f.read()
+
+    # Rows stream straight from the parser into the multi-row inserts, in one
+    # explicit transaction committed once below. Buffered (--jobs workers): parse
+    # everything first so the write lock is held only for the inserts.
+    rows = iter_item_rows(content, item_ids)
+    if buffered:
+        rows = list(rows)
+    conn.execute("BEGIN IMMEDIATE")
+    count = bulk_insert(conn, "items", ITEM_COLUMNS, rows)
+    conn.execute("COMMIT")
+    print(f"Processed {count} items.")
+    return count
+
 
-    conn.commit()
-    print(f"Processed {items_processed} items.")
+def open_db() -> sqlite3.Connection:
+    """Opens the knowledge base with the bulk-load connection settings.
+
+    Autocommit mode means sqlite3 issues no implicit BEGINs; each ingest manages
+    its own transaction. Relaxed syncing (under WAL, set in `main`) makes each table
+    load cost a single commit fsync, and the page cache is enlarged for the inserts.
+
+    Returns:
+        sqlite3.Connection: The configured connection.
+    """
+    # Busy timeout covers --jobs workers queueing for the write lock behind each other's inserts
+    conn = sqlite3.connect(DB_PATH, isolation_level=None, timeout=30)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-200000")
+    return conn
+
+INGESTERS = {
+    "moves": ingest_moves,
+    "species": ingest_species,
+    "items": ingest_items,
+}
+
+def ingest_table(name: str) -> int:
+    """Ingests one table on its own connection (a worker for ``--jobs``).
+
+    Args:
+        name (str): Key into INGESTERS.
+
+    Returns:
+        int: Number of rows written.
+    """
+    conn = open_db()
+    try:
+        # Parse outside the write transaction so workers' parsing actually overlaps
+        count = INGESTERS[name](conn, buffered=True)
+        for index_sql in TABLE_INDEXES[name]:
+            conn.execute(index_sql)
+        return count
+    finally:
+        conn.close()
 
+@functools.lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the command-line parser once; seed_master calls main() in-process."""
+    parser = argparse.ArgumentParser(description="Ingest raw headers into the knowledge base.")
+    parser.add_argument("--tables", help="Comma-separated subset of moves,species,items to re-ingest (default: full reset)")
+    parser.add_argument("--jobs", type=int, default=1, help="Ingest tables in this many parallel processes (default: 1)")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    tables = None
+    selected = list(INGESTERS)
+    if args.tables:
+        tables = [t.strip() for t in args.tables.split(",") if t.strip()]
+        unknown = [t for t in tables if t not in INGESTERS]
+        if unknown:
+            parser.error(f"unknown table(s): {', '.join(unknown)}")
+        selected = [name for name in INGESTERS if name in tables]
 
-def main():
     if not os.path.exists(DB_PATH):
         # Ensure dir exists
         os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = open_db()
+    # WAL also lets the --jobs workers' write transactions queue up behind each other
+    conn.execute("PRAGMA journal_mode=WAL")
     
     try:
-        setup_database(conn)
-        ingest_moves(conn)
-        ingest_species(conn)
-        ingest_items(conn)
+        setup_database(conn, tables)
+        if args.jobs > 1 and len(selected) > 1:
+            # Tables and source headers are disjoint, so the regex parsing overlaps across processes
+            with ProcessPoolExecutor(max_workers=min(args.jobs, len(selected))) as pool:
+                list(pool.map(ingest_table, selected))
+        else:
+            for name in selected:
+                INGESTERS[name](conn)
+                for index_sql in TABLE_INDEXES[name]:
+                    conn.execute(index_sql)
+
+        # A full reset drops bfm_denorm along with the rest; an incremental run
+        # leaves it holding the old names, which inspect_db would keep showing
+        if tables is not None and conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bfm_denorm'"
+        ).fetchone():
+            conn.executescript(BFM_DENORM_SQL)
         
         print("Done.")
     finally:
+        # A failed ingest leaves its BEGIN IMMEDIATE open; the journal mode can't
+        # change inside a transaction, and the original error must surface
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        # Back to a rollback journal so the shipped .db stays a single self-contained file
+        conn.execute("PRAGMA journal_mode=DELETE")
         conn.close()
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import sqlite3
 import argparse
 import os
+import sys
 
 """
 DB Inspection Utility.
@@ -15,21 +16,13 @@ Usage:
 
 DB_PATH = "src/data/knowledge_base.db"
 
-def inspect_db(limit: int = 10, search: str = None) -> None:
-    """Queries the database for Battle Frontier Pokémon and prints a formatted table.
+# Output table layout: (header, column width)
+HEADERS = ["ID", "Species", "Move 1", "Move 2", "Move 3", "Move 4", "Item", "Nature", "EVs"]
+COL_WIDTHS = [5, 15, 15, 15, 15, 15, 20, 10, 5]
+HEADER_ROW = "".join(h.ljust(w) for h, w in zip(HEADERS, COL_WIDTHS))
+RULE_ROW = "-" * len(HEADER_ROW)
 
-    Args:
-        limit (int): Max number of rows to return.
-        search (str): Optional search term (Species Name or ID).
-    """
-    if not os.path.exists(DB_PATH):
-        print(f"Database not found at {DB_PATH}")
-        return
-
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    query = """
+JOIN_QUERY = """
     SELECT 
         bfm.id, 
         s.name AS species, 
@@ -48,36 +41,60 @@ def inspect_db(limit: int = 10, search: str = None) -> None:
     LEFT JOIN moves m4 ON bfm.move4_id = m4.id
     LEFT JOIN items i ON bfm.item_id = i.id
     """
+
+def inspect_db(limit: int = 10, search: str = None) -> None:
+    """Queries the database for Battle Frontier Pokémon and prints a formatted table.
+
+    Args:
+        limit (int): Max number of rows to return.
+        search (str): Optional search term (Species Name or ID).
+    """
+    if not os.path.exists(DB_PATH):
+        print(f"Database not found at {DB_PATH}")
+        return
+
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    
+    # bfm_denorm (built by seed_facility_mons.py) has the names pre-joined;
+    # fall back to the join for databases seeded before it existed
+    has_denorm = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bfm_denorm'"
+    ).fetchone() is not None
+    if has_denorm:
+        query = "SELECT id, species, move1, move2, move3, move4, item, nature, ev_spread FROM bfm_denorm"
+        id_col, species_col = "id", "species"
+    else:
+        query = JOIN_QUERY
+        id_col, species_col = "bfm.id", "s.name"
     
     params = []
     if search:
         # Search by Species Name or ID
         if search.isdigit():
-            query += " WHERE bfm.id = ?"
+            query += f" WHERE {id_col} = ?"
             params.append(int(search))
         else:
-            query += " WHERE s.name LIKE ?"
+            # Substring match: the leading wildcard means this still scans rather
+            # than using the species name index
+            query += f" WHERE {species_col} LIKE ?"
             params.append(f"%{search}%")
             
-    query += f" LIMIT {limit}"
+    query += " LIMIT ?"
+    params.append(int(limit))
     
     try:
         cursor.execute(query, params)
         rows = cursor.fetchall()
         
-        # Formatting
-        headers = ["ID", "Species", "Move 1", "Move 2", "Move 3", "Move 4", "Item", "Nature", "EVs"]
-        col_widths = [5, 15, 15, 15, 15, 15, 20, 10, 5]
-        
-        header_row = "".join(h.ljust(w) for h, w in zip(headers, col_widths))
-        print("-" * len(header_row))
-        print(header_row)
-        print("-" * len(header_row))
-        
+        # Formatting: build the whole table, then write it once
+        lines = [RULE_ROW, HEADER_ROW, RULE_ROW]
         for row in rows:
             # Handle None values
             cleaned_row = [str(x) if x is not None else "" for x in row]
-            print("".join(val[:w-1].ljust(w) for val, w in zip(cleaned_row, col_widths)))
+            lines.append("".join(val[:w-1].ljust(w) for val, w in zip(cleaned_row, COL_WIDTHS)))
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
             
     except sqlite3.Error as e:
         print(f"Database error: {e}")
@@ -31,6 +31,33 @@ FILES = {
     "poke_consts": os.path.join(RAW_DIR, "pokemon_constants.h")
 }
 
+# Read-optimized copy of the sets with names already joined in, for inspect_db.py.
+# Rebuilt whenever the sets are seeded.
+BFM_DENORM_SQL = """
+DROP TABLE IF EXISTS bfm_denorm;
+CREATE TABLE bfm_denorm AS
+SELECT
+    bfm.id,
+    s.name AS species,
+    m1.name AS move1,
+    m2.name AS move2,
+    m3.name AS move3,
+    m4.name AS move4,
+    i.name AS item,
+    bfm.nature,
+    bfm.ev_spread
+FROM battle_frontier_mons bfm
+LEFT JOIN species s ON bfm.species_id = s.id
+LEFT JOIN moves m1 ON bfm.move1_id = m1.id
+LEFT JOIN moves m2 ON bfm.move2_id = m2.id
+LEFT JOIN moves m3 ON bfm.move3_id = m3.id
+LEFT JOIN moves m4 ON bfm.move4_id = m4.id
+LEFT JOIN items i ON bfm.item_id = i.id
+ORDER BY bfm.id;
+CREATE INDEX idx_bfm_denorm_id ON bfm_denorm(id);
+CREATE INDEX idx_bfm_denorm_species ON bfm_denorm(species COLLATE NOCASE);
+"""
+
 def load_defines(path: str, prefix: str = "") -> Dict[str, int]:
     """Parses #define CONSTANT val."""
     mapping = {}
@@ -93,6 +120,9 @@ def seed_facility_mons():
     # Resolve Item IDs
     # Map: BF_ITEM_VALUE -> GAME_ITEM_ID
     item_resolver = resolve_item_map(bf_item_defines, item_map)
+    
+    # EV Spread flags: F_EV_SPREAD_X -> Bit
+    ev_consts = load_defines(FILES["bf_consts"], "F_EV_SPREAD_")
     print(f"Resolved {len(item_resolver)} item mappings.")
     print(f"Loaded {len(move_map)} moves from constants.")
 
@@ -104,9 +134,8 @@ def seed_facility_mons():
     # The file starts with "const struct ... = {" so the first split might be garbage or the start.
     chunks = content.split("[FRONTIER_MON_")
     
-    data_list = []
+    final_rows = []
     
-    count = 0
     # Skip the first chunk as it contains preamble
     for chunk in chunks[1:]:
         # format: "NAME] = {\n ... body ... \n    },\n    ..."
@@ -164,45 +193,22 @@ def seed_facility_mons():
             
         # 5. EV Spread
         # .evSpread = F_EV_SPREAD_SP_ATTACK | ...
+        # Resolved to its bitmask here so each mon is handled in a single pass
         m_ev = re.search(r'\.evSpread\s*=\s*([^,]+),', body)
-        ev_spread_str = "0"
-        if m_ev:
-            ev_spread_str = m_ev.group(1).strip()
-        
-        data_list.append({
-            'id': f_id,
-            'species_id': species_id,
-            'move1': moves[0],
-            'move2': moves[1],
-            'move3': moves[2],
-            'move4': moves[3],
-            'item_id': item_id,
-            'nature': nature,
-            'ev_spread_str': ev_spread_str
-        })
-        count += 1
-
-    # Resolve EV Spreads properly
-    # Load F_EV constants
-    ev_consts = load_defines(FILES["bf_consts"], "F_EV_SPREAD_")
-    
-    final_rows = []
-    for row in data_list:
         ev_val = 0
-        parts = [p.strip() for p in row['ev_spread_str'].split('|')]
-        for p in parts:
-            if p in ev_consts:
-                ev_val |= ev_consts[p]
+        if m_ev:
+            for p in m_ev.group(1).split('|'):
+                ev_val |= ev_consts.get(p.strip(), 0)
         
         final_rows.append((
-            row['id'],
-            row['species_id'],
-            row['move1'],
-            row['move2'],
-            row['move3'],
-            row['move4'],
-            row['item_id'],
-            row['nature'],
+            f_id,
+            species_id,
+            moves[0],
+            moves[1],
+            moves[2],
+            moves[3],
+            item_id,
+            nature,
             ev_val
         ))
 
@@ -218,6 +224,9 @@ def seed_facility_mons():
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
     """, final_rows)
     conn.commit()
+    # Built once the sets are loaded; speeds up species lookups/joins over the table
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_bfm_species ON battle_frontier_mons(species_id)")
+    conn.executescript(BFM_DENORM_SQL)
     conn.close()
     print("Done.")
 
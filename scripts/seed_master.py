@@ -12,12 +12,14 @@ if current_dir not in sys.path:
 try:
     from ingest_data import main as ingest_main
     from seed_facility_mons import seed_facility_mons
-    # seed_items is largely redundant with ingest_data but we can run it if needed.
-    # ingest_data does a better job with full item data.
+    # seed_items fills in the item IDs that ingest_data's item table doesn't cover.
+    from seed_items import parse_header, seed_db, HEADER_PATH
 except ImportError as e:
     print(f"Error importing seeding scripts: {e}")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
 def setup_logging():
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -36,23 +38,21 @@ def main():
     try:
         ingest_main()
     except Exception as e:
-        print(f"Error in ingest_data: {e}")
+        logger.exception("Error in ingest_data: %s", e)
         # sys.exit(1) # Optional: stop on error
 
     print("\n[STEP 2/3] Seeding All Item IDs...")
     try:
-        # Import here to avoid early import issues if needed, or just rely on top-level
-        from seed_items import parse_header, seed_db, HEADER_PATH
         items = parse_header(HEADER_PATH)
         seed_db(items)
     except Exception as e:
-        print(f"Error in seed_items: {e}")
+        logger.exception("Error in seed_items: %s", e)
 
     print("\n[STEP 3/3] Seeding Battle Factory Pokémon Sets...")
     try:
         seed_facility_mons()
     except Exception as e:
-        print(f"Error in seed_facility_mons: {e}")
+        logger.exception("Error in seed_facility_mons: %s", e)
         sys.exit(1)
         
     print("\n=== SEEDING COMPLETE ===")
@@ -1,9 +1,13 @@
 import socket
 import time
 import logging
+from typing import Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Well above the largest reply (READ_BLOCK of the battle region, 2 hex chars per byte)
+RECV_BUFFER_SIZE = 65536
+
 class MgbaClient:
     """Client for communicating with the mGBA Lua connector.
     
@@ -21,24 +25,33 @@ class MgbaClient:
         self.host = host
         self.port = port
         self.sock = None
+        # Reused for every reply so polling loops don't allocate a fresh bytes per recv
+        self._rxbuf = bytearray(RECV_BUFFER_SIZE)
+        self._rxview = memoryview(self._rxbuf)
+        # Bytes already received past the last returned reply
+        self._rxlen = 0
 
     def connect(self) -> None:
         """Establishes functionality connection to the mGBA server.
         
         Raises:
             ConnectionRefusedError: If the connection fails (e.g. emulator not running).
+            socket.timeout: If the connector does not answer the initial PING.
         """
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Small request/reply commands: send each immediately instead of waiting on Nagle
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to mGBA at {self.host}:{self.port}")
-            # Clear any initial banner message
-            self.sock.settimeout(0.1)
-            try:
-                while self.sock.recv(1024): pass
-            except socket.timeout:
-                pass
+            logger.info("Connected to mGBA at %s:%s", self.host, self.port)
             self.sock.settimeout(2.0) # Set reasonable timeout for commands
+            # Sync on a PING instead of idling through a fixed banner-drain timeout:
+            # returns as soon as the connector answers, skipping anything sent before.
+            self._rxlen = 0
+            self.sock.sendall(b"PING\n")
+            while self._recv_line() != "PONG":
+                pass
         except ConnectionRefusedError:
             logger.error("Connection refused. Is mGBA running with connector.lua?")
             raise
@@ -48,6 +61,7 @@ class MgbaClient:
         if self.sock:
             self.sock.close()
             self.sock = None
+            self._rxlen = 0
             logger.info("Disconnected from mGBA")
 
     def _send(self, cmd: str) -> str:
@@ -57,7 +71,8 @@ class MgbaClient:
             cmd (str): The command string (e.g., "READ_U16 020244EC").
 
         Returns:
-            str: The raw response string, trimmed of whitespace.
+            str: The raw response string, trimmed of whitespace. "ERROR: Timeout" if
+                no reply arrived in time; the connection is closed in that case.
 
         Raises:
             RuntimeError: If not connected.
@@ -68,16 +83,110 @@ class MgbaClient:
         
         try:
             self.sock.sendall((cmd + "\n").encode('utf-8'))
-            response = self.sock.recv(4096).decode('utf-8').strip()
-            # Handle multi-line responses? usage suggests single line responses mostly
-            return response
+            return self._recv_line()
         except socket.timeout:
-            logger.error(f"Timeout waiting for response to: {cmd}")
+            logger.error("Timeout waiting for response to: %s", cmd)
+            # The late reply would be read as the answer to the next command
+            self.disconnect()
             return "ERROR: Timeout"
         except Exception as e:
-            logger.error(f"Socket error: {e}")
+            logger.error("Socket error: %s", e)
+            self.disconnect()
+            raise
+
+    def send_many(self, cmds: List[str]) -> List[str]:
+        """Pipelines several commands: one send, then all replies in order.
+
+        The connector answers commands in the order received, so N independent
+        requests cost a single round-trip instead of N.
+
+        Args:
+            cmds (List[str]): Command strings, without newlines.
+
+        Returns:
+            List[str]: One trimmed reply per command. Replies still missing when the
+                socket times out come back as "ERROR: Timeout", like `_send`, and the
+                connection is closed.
+
+        Raises:
+            RuntimeError: If not connected.
+            socket.error: On I/O failure.
+        """
+        if not self.sock:
+            raise RuntimeError("Not connected to mGBA")
+
+        replies = []
+        try:
+            self.sock.sendall(("\n".join(cmds) + "\n").encode('utf-8'))
+            for _ in cmds:
+                replies.append(self._recv_line())
+        except socket.timeout:
+            logger.error("Timeout waiting for response to: %s", cmds[len(replies)])
+            # The rest of the batch is still in flight and would shift every later reply
+            self.disconnect()
+            replies.extend(["ERROR: Timeout"] * (len(cmds) - len(replies)))
+        except Exception as e:
+            logger.error("Socket error: %s", e)
             self.disconnect()
             raise
+        return replies
+
+    def _recv_line(self) -> str:
+        """Returns the next newline-terminated reply from the receive buffer.
+
+        Each recv drains whatever the socket has, so several queued replies can
+        arrive in a single syscall. Bytes past the returned line are kept at the
+        front of the buffer for the next call.
+
+        Returns:
+            str: The reply, trimmed of whitespace.
+
+        Raises:
+            ConnectionError: If mGBA closed the connection or the reply overflows the buffer.
+        """
+        buf, view = self._rxbuf, self._rxview
+        size = self._rxlen
+        end = buf.find(b"\n", 0, size)
+        while end < 0:
+            if size == len(buf):
+                raise ConnectionError(f"Reply exceeds {len(buf)} bytes")
+            n = self.sock.recv_into(view[size:])
+            if not n:
+                raise ConnectionError("Connection closed by mGBA")
+            # Only the new bytes can hold the terminator
+            end = buf.find(b"\n", size, size + n)
+            size += n
+            # Record progress now: a timeout on the next recv must not drop these bytes
+            self._rxlen = size
+        line = buf[:end].decode('utf-8').strip()
+        rest = size - end - 1
+        if rest:
+            buf[:rest] = buf[end + 1:size]
+        self._rxlen = rest
+        return line
+
+    def _send_read(self, cmd: str, addr: int, offset: Optional[int] = None) -> str:
+        """Sends a read command and returns its response, rejecting ERROR replies.
+
+        The error message is only formatted on failure, keeping the success path to a
+        single prefix check.
+
+        Args:
+            cmd (str): The read command string.
+            addr (int): Address being read (the pointer address for pointer reads).
+            offset (Optional[int]): Offset added to the dereferenced pointer, if any.
+
+        Returns:
+            str: The raw response string.
+
+        Raises:
+            ValueError: If the connector replied with an error.
+        """
+        resp = self._send(cmd)
+        if resp.startswith("ERROR"):
+            where = f"{addr:X}" if offset is None else f"ptr {addr:X} + {offset:X}"
+            raise ValueError(f"Read error at {where}: {resp}")
+        return resp
 
     def ping(self) -> bool:
         """Checks connection vitality."""
@@ -87,20 +196,17 @@ class MgbaClient:
     def read_u8(self, addr: int) -> int:
         """Reads an unsigned 8-bit integer from memory."""
         # Client side implementation using READ_BLOCK for single byte since lua might not have READ_U8
-        resp = self._send(f"READ_BLOCK {addr:X} 1")
-        if "ERROR" in resp: raise ValueError(f"Read error at {addr:X}: {resp}")
+        resp = self._send_read(f"READ_BLOCK {addr:X} 1", addr)
         return int(resp, 16)
 
     def read_u16(self, addr: int) -> int:
         """Reads an unsigned 16-bit integer from memory."""
-        resp = self._send(f"READ_U16 {addr:X}")
-        if "ERROR" in resp: raise ValueError(f"Read error at {addr:X}: {resp}")
+        resp = self._send_read(f"READ_U16 {addr:X}", addr)
         return int(resp)
 
     def read_u32(self, addr: int) -> int:
         """Reads an unsigned 32-bit integer from memory."""
-        resp = self._send(f"READ_U32 {addr:X}")
-        if "ERROR" in resp: raise ValueError(f"Read error at {addr:X}: {resp}")
+        resp = self._send_read(f"READ_U32 {addr:X}", addr)
         return int(resp)
 
     def read_block(self, addr: int, size: int) -> bytes:
@@ -113,8 +219,7 @@ class MgbaClient:
         Returns:
             bytes: The read byte data.
         """
-        resp = self._send(f"READ_BLOCK {addr:X} {size:X}")
-        if "ERROR" in resp: raise ValueError(f"Read error at {addr:X}: {resp}")
+        resp = self._send_read(f"READ_BLOCK {addr:X} {size:X}", addr)
         return bytes.fromhex(resp)
 
     def read_ptr(self, ptr_addr: int, offset: int, size: int) -> bytes:
@@ -127,16 +232,89 @@ class MgbaClient:
             offset (int): Offset to add to the dereferenced pointer.
             size (int): Number of bytes to read.
         """
-        resp = self._send(f"READ_PTR {ptr_addr:X} {offset:X} {size:X}")
-        if "ERROR" in resp: raise ValueError(f"Read error at ptr {ptr_addr:X} + {offset:X}: {resp}")
+        resp = self._send_read(f"READ_PTR {ptr_addr:X} {offset:X} {size:X}", ptr_addr, offset)
         return bytes.fromhex(resp)
 
     def read_ptr_u16(self, ptr_addr: int, offset: int) -> int:
         """Reads a u16 from a pointer plus offset."""
-        resp = self._send(f"READ_PTR_U16 {ptr_addr:X} {offset:X}")
-        if "ERROR" in resp: raise ValueError(f"Read error at ptr {ptr_addr:X} + {offset:X}: {resp}")
+        resp = self._send_read(f"READ_PTR_U16 {ptr_addr:X} {offset:X}", ptr_addr, offset)
+        return int(resp)
+
+    def tap_sequence(self, steps: Iterable[Tuple[int, int, int]]) -> int:
+        """Queues a whole button sequence with a single command.
+
+        The connector schedules every step on its frame-based key queue, so a
+        menu navigation costs one round-trip instead of one per button.
+
+        Args:
+            steps: `(button_mask, hold_frames, wait_frames)` tuples, in order.
+                Each step waits `wait_frames` idle frames after its release.
+
+        Returns:
+            int: Number of frames the sequence spans from now.
+
+        Raises:
+            ValueError: If the connector rejected the sequence.
+        """
+        cmd = "TAP_SEQUENCE " + " ".join(f"{mask}:{frames}:{wait}" for mask, frames, wait in steps)
+        resp = self._send(cmd)
+        if resp.startswith("ERROR"):
+            raise ValueError(f"Sequence rejected: {resp}")
         return int(resp)
 
+    def wait_frames(self, frames: int) -> None:
+        """Blocks until the emulator has run `frames` more frames.
+
+        The connector defers its reply until the frames have elapsed, so the wait
+        costs one round-trip instead of polling GET_FRAME.
+
+        Args:
+            frames (int): Number of frames to wait.
+
+        Raises:
+            RuntimeError: If the connector rejected the wait or it timed out.
+        """
+        # Leave room for the wait itself at normal speed (60 fps) on top of the usual timeout
+        timeout = self.sock.gettimeout() if self.sock else None
+        if timeout is not None:
+            self.sock.settimeout(timeout + frames / 60)
+        try:
+            resp = self._send(f"WAIT_FRAMES {frames}")
+        finally:
+            if timeout is not None and self.sock:
+                self.sock.settimeout(timeout)
+        if resp != "OK":
+            raise RuntimeError(f"WAIT_FRAMES {frames} failed: {resp}")
+
+    def save_state(self, name: str = "default") -> None:
+        """Snapshots the emulator state into a named in-memory slot on the Lua side.
+
+        Lets a deterministic setup sequence run once and be restored with
+        `load_state` instead of being replayed.
+
+        Args:
+            name (str): Slot name (no whitespace).
+
+        Raises:
+            RuntimeError: If the connector could not save the state.
+        """
+        resp = self._send(f"SAVE_STATE {name}")
+        if resp != "OK":
+            raise RuntimeError(f"SAVE_STATE {name} failed: {resp}")
+
+    def load_state(self, name: str = "default") -> None:
+        """Restores a slot previously written by `save_state`.
+
+        Args:
+            name (str): Slot name.
+
+        Raises:
+            RuntimeError: If the slot does not exist or could not be loaded.
+        """
+        resp = self._send(f"LOAD_STATE {name}")
+        if resp != "OK":
+            raise RuntimeError(f"LOAD_STATE {name} failed: {resp}")
+
     def input_waiting(self) -> bool:
         """Checks if the emulator is waiting for input (WaitFrame)."""
         resp = self._send("IS_WAITING_INPUT")
@@ -43,6 +43,12 @@ SIZE_BATTLE_MON = 88      # Gen 3 Active Battle Pokemon Structure Size
 SIZE_RENTAL_MON = 12      # Factory Rental Pokemon Compact Structure Size
 PARTY_SIZE = 6
 
+# Battle Region: gBattleMons, gLastMoves, gBattleOutcome, weather, gPlayerParty and
+# gEnemyParty all live in one contiguous EWRAM span. Reading it as a single block
+# lets a snapshot fetch every battle/party struct with one round-trip.
+ADDR_BATTLE_REGION = ADDR_BATTLE_MONS
+SIZE_BATTLE_REGION = (ADDR_ENEMY_PARTY + SIZE_POKEMON * PARTY_SIZE) - ADDR_BATTLE_REGION
+
 # Battle Frontier Offsets (Relative to SaveBlock2 Base)
 # Note: It is safer to read the pointer at ADDR_SAVEBLOCK2_PTR than assume 0x02024a54
 OFFSET_FRONTIER_LVL_MODE = 0xCA9       # u8 (0=Lvl 50, 1=Open Lvl)
@@ -58,6 +64,15 @@ BATTLE_OUTCOME_LOSS = 2
 BATTLE_OUTCOME_DRAW = 3
 BATTLE_OUTCOME_RAN = 4
 
+# Display names for gBattleOutcome values
+BATTLE_OUTCOME_NAMES = {
+    BATTLE_OUTCOME_ONGOING: "Ongoing",
+    BATTLE_OUTCOME_WIN: "Won",
+    BATTLE_OUTCOME_LOSS: "Lost",
+    BATTLE_OUTCOME_DRAW: "Draw",
+    BATTLE_OUTCOME_RAN: "Ran",
+}
+
 # Map Layout IDs
 LAYOUT_FACTORY_PRE_BATTLE = 347 # Lobby/Drafting/Swapping Room
 LAYOUT_FACTORY_BATTLE = 348     # Battle Arena
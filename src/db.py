@@ -5,6 +5,16 @@ from typing import Optional, Tuple, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Cached detail dicts are shared across lookups, and callers splat them into
+# dataclasses, so every hand-out gets its own copies of the nested containers.
+def _copy_move_details(d: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    return None if d is None else {**d, "flags": list(d["flags"])}
+
+def _copy_species_details(d: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if d is None:
+        return None
+    return {**d, "base_stats": dict(d["base_stats"]), "abilities": list(d["abilities"])}
+
 class PokemonDatabase:
     """Handles interactions with the SQLite knowledge base.
 
@@ -14,6 +24,14 @@ class PokemonDatabase:
     Attributes:
         db_path (str): Path to the SQLite database file.
         conn (sqlite3.Connection): Active database connection or None.
+        move_names (Dict[int, str]): Move ID -> name, preloaded on connect.
+        species_names (Dict[int, str]): Species ID -> name, preloaded on connect.
+        item_names (Dict[int, str]): Item ID -> name, preloaded on connect.
+
+    Detail lookups are cached per ID for the lifetime of the connection, since the
+    knowledge base is static and the same few mons, moves and items are looked up
+    on every snapshot. Each call returns fresh containers, so mutating a result never
+    touches the cache.
     """
 
     def __init__(self, db_path: str = "src/data/knowledge_base.db"):
@@ -24,27 +42,51 @@ class PokemonDatabase:
         """
         self.db_path = db_path
         self.conn = None
-        
+        self.move_names: Dict[int, str] = {}
+        self.species_names: Dict[int, str] = {}
+        self.item_names: Dict[int, str] = {}
+        self._move_details: Dict[int, Optional[Dict[str, Any]]] = {}
+        self._species_details: Dict[int, Optional[Dict[str, Any]]] = {}
+        self._item_details: Dict[int, Dict[str, Any]] = {}
+
     def connect(self) -> None:
         """Establishes a connection to the SQLite database.
 
-        Sets the row_factory to sqlite3.Row for name-based access.
+        Sets the row_factory to sqlite3.Row for name-based access and preloads the
+        move/species/item name tables used by the `get_*_name` helpers.
         Logs an error if the database file does not exist or connection fails.
         """
         if not os.path.exists(self.db_path):
-            logger.error(f"Database not found at {self.db_path}")
+            logger.error("Database not found at %s", self.db_path)
             return
         try:
             self.conn = sqlite3.connect(self.db_path)
             self.conn.row_factory = sqlite3.Row
+            self._load_name_tables()
         except sqlite3.Error as e:
-            logger.error(f"Database connection error: {e}")
+            logger.error("Database connection error: %s", e)
+
+    def _load_name_tables(self) -> None:
+        """Loads the ID -> name tables in one query per table.
+
+        Names are looked up for every mon, move and item on each snapshot; keeping
+        them in memory turns those lookups into dict hits instead of SQL queries.
+        """
+        self.move_names = dict(self.conn.execute("SELECT id, name FROM moves").fetchall())
+        self.species_names = dict(self.conn.execute("SELECT id, name FROM species").fetchall())
+        self.item_names = dict(self.conn.execute("SELECT id, name FROM items").fetchall())
 
     def close(self) -> None:
         """Closes the current database connection if active."""
         if self.conn:
             self.conn.close()
             self.conn = None
+        self.move_names = {}
+        self.species_names = {}
+        self.item_names = {}
+        self._move_details.clear()
+        self._species_details.clear()
+        self._item_details.clear()
 
 
     def get_move_details(self, move_id: int) -> Optional[Dict[str, Any]]: # Forward ref or import if needed, assuming dynamic typing in db layer mostly
@@ -68,16 +110,20 @@ class PokemonDatabase:
         # Existing code returns strings.
         # Let's return dictionaries for now to be safe.
         if not self.conn: return None
+        if move_id in self._move_details:
+            return _copy_move_details(self._move_details[move_id])
         cursor = self.conn.cursor()
         cursor.execute("SELECT * FROM moves WHERE id = ?", (move_id,))
         row = cursor.fetchone()
-        if not row: return None
+        if not row:
+            self._move_details[move_id] = None
+            return None
         
         # Parse flags
         flags_str = row['flags'] or ""
         flags = [f.strip() for f in flags_str.split('|') if f.strip()]
         
-        return {
+        details = {
             "id": row['id'],
             "name": row['name'],
             "type": row['type'],
@@ -90,6 +136,8 @@ class PokemonDatabase:
             "flags": flags,
             "split": row['split']
         }
+        self._move_details[move_id] = details
+        return _copy_move_details(details)
 
     def get_species_details(self, species_id: int) -> Optional[Dict[str, Any]]:
         """Retrieves base stats and types for a Pokémon species.
@@ -102,12 +150,16 @@ class PokemonDatabase:
                                       or None if not found.
         """
         if not self.conn: return None
+        if species_id in self._species_details:
+            return _copy_species_details(self._species_details[species_id])
         cursor = self.conn.cursor()
         cursor.execute("SELECT * FROM species WHERE id = ?", (species_id,))
         row = cursor.fetchone()
-        if not row: return None
+        if not row:
+            self._species_details[species_id] = None
+            return None
         
-        return {
+        details = {
             "id": row['id'],
             "name": row['name'],
             "type1": row['type1'],
@@ -122,6 +174,8 @@ class PokemonDatabase:
             },
             "abilities": [row['ability1'], row['ability2']]
         }
+        self._species_details[species_id] = details
+        return _copy_species_details(details)
 
     def get_item_details(self, item_id: int) -> Dict[str, Any]:
         """Retrieves details for an item.
@@ -134,41 +188,45 @@ class PokemonDatabase:
                             if the item is not found in the database.
         """
         if not self.conn: return None
+        if item_id in self._item_details:
+            return dict(self._item_details[item_id])
         cursor = self.conn.cursor()
         cursor.execute("SELECT * FROM items WHERE id = ?", (item_id,))
         row = cursor.fetchone()
         if not row: 
             # Fallback for empty item
-            return {
+            details = {
                 "id": item_id,
                 "name": f"Item {item_id}",
                 "description": "",
                 "hold_effect": "None",
                 "hold_effect_param": 0
             }
-
-        return {
-            "id": row['id'],
-            "name": row['name'],
-            "description": row['description'],
-            "hold_effect": row['hold_effect'],
-            "hold_effect_param": row['hold_effect_param']
-        }
+        else:
+            details = {
+                "id": row['id'],
+                "name": row['name'],
+                "description": row['description'],
+                "hold_effect": row['hold_effect'],
+                "hold_effect_param": row['hold_effect_param']
+            }
+        self._item_details[item_id] = details
+        return dict(details)
         
     def get_move_name(self, move_id: int) -> str:
         """Helper to get just the name of a move."""
-        d = self.get_move_details(move_id)
-        return d['name'] if d else f"Move {move_id}"
+        name = self.move_names.get(move_id)
+        return name if name is not None else f"Move {move_id}"
         
     def get_species_name(self, species_id: int) -> str:
         """Helper to get just the name of a species."""
-        d = self.get_species_details(species_id)
-        return d['name'] if d else f"Species {species_id}"
+        name = self.species_names.get(species_id)
+        return name if name is not None else f"Species {species_id}"
         
     def get_item_name(self, item_id: int) -> str:
         """Helper to get just the name of an item."""
-        d = self.get_item_details(item_id)
-        return d['name'] if d else f"Item {item_id}"
+        name = self.item_names.get(item_id)
+        return name if name is not None else f"Item {item_id}"
     
     def get_rental_mon_species_name(self, facility_mon_id: int) -> str:
         """Resolves the species name for a Battle Factory rental Pokémon ID.
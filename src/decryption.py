@@ -1,4 +1,4 @@
-import struct
+import numpy as np
 
 """
 Gen 3 Pokémon Encryption Logic.
@@ -21,14 +21,33 @@ def decrypt_data(data: bytes, key: int) -> bytes:
     Returns:
         bytes: The decrypted data.
     """
-    decrypted = bytearray()
-    for i in range(0, len(data), 4):
-        chunk = struct.unpack('<I', data[i:i+4])[0]
-        decrypted_chunk = chunk ^ key
-        decrypted.extend(struct.pack('<I', decrypted_chunk))
-    return bytes(decrypted)
-
-def get_substructure_order(pid: int) -> list:
+    # XOR every little-endian u32 word in one vectorized pass
+    words = np.frombuffer(data, dtype="<u4")
+    return (words ^ np.uint32(key)).astype("<u4", copy=False).tobytes()
+
+def decrypt_substructures(substructs: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """Decrypts the substructure blocks of several Pokémon in one vectorized pass.
+
+    Args:
+        substructs (np.ndarray): (N, 12) array of encrypted little-endian u32 words.
+        keys (np.ndarray): (N,) array of 32-bit keys (PID ^ OTID), one per Pokémon.
+
+    Returns:
+        np.ndarray: (N, 12) array of decrypted little-endian u32 words.
+    """
+    # Same cast as decrypt_data: the XOR result takes the host byte order otherwise
+    return (substructs ^ keys[:, np.newaxis]).astype("<u4", copy=False)
+
+# Permutation table indexed by PID % 24 (0 = Growth, 1 = Attacks, 2 = EVs, 3 = Misc).
+# Built once at import so the per-mon decode path never reallocates it.
+SUBSTRUCTURE_ORDERS = (
+    (0, 1, 2, 3), (0, 1, 3, 2), (0, 2, 1, 3), (0, 2, 3, 1), (0, 3, 1, 2), (0, 3, 2, 1),
+    (1, 0, 2, 3), (1, 0, 3, 2), (1, 2, 0, 3), (1, 2, 3, 0), (1, 3, 0, 2), (1, 3, 2, 0),
+    (2, 0, 1, 3), (2, 0, 3, 1), (2, 1, 0, 3), (2, 1, 3, 0), (2, 3, 0, 1), (2, 3, 1, 0),
+    (3, 0, 1, 2), (3, 0, 2, 1), (3, 1, 0, 2), (3, 1, 2, 0), (3, 2, 0, 1), (3, 2, 1, 0),
+)
+
+def get_substructure_order(pid: int) -> tuple:
     """Determines the permutation order of substructures.
 
     The 48-byte data block is divided into 4 substructures (G, A, E, M) of 12 bytes.
@@ -38,16 +57,9 @@ def get_substructure_order(pid: int) -> list:
         pid (int): Personality Value.
 
     Returns:
-        list: A list of 4 integers representing the order (0=Growth, 1=Attacks, 2=EVs, 3=Misc).
+        tuple: 4 integers representing the order (0=Growth, 1=Attacks, 2=EVs, 3=Misc).
     """
-    # 0 = Growth, 1 = Attacks, 2 = EVs, 3 = Misc
-    orders = [
-        [0, 1, 2, 3], [0, 1, 3, 2], [0, 2, 1, 3], [0, 2, 3, 1], [0, 3, 1, 2], [0, 3, 2, 1],
-        [1, 0, 2, 3], [1, 0, 3, 2], [1, 2, 0, 3], [1, 2, 3, 0], [1, 3, 0, 2], [1, 3, 2, 0],
-        [2, 0, 1, 3], [2, 0, 3, 1], [2, 1, 0, 3], [2, 1, 3, 0], [2, 3, 0, 1], [2, 3, 1, 0],
-        [3, 0, 1, 2], [3, 0, 2, 1], [3, 1, 0, 2], [3, 1, 2, 0], [3, 2, 0, 1], [3, 2, 1, 0],
-    ]
-    return orders[pid % 24]
+    return SUBSTRUCTURE_ORDERS[pid % 24]
 
 def unshuffle_substructures(data: bytes, pid: int) -> bytes:
     """Reorders the shuffled substructures into the standard 'GAEM' order.
@@ -72,11 +84,13 @@ def unshuffle_substructures(data: bytes, pid: int) -> bytes:
         raise ValueError(f"Substructure data must be 48 bytes, got {len(data)}")
 
     order = get_substructure_order(pid)
+    # Slice through a memoryview so the four blocks are views, copied only once by join
+    view = memoryview(data)
     blocks = [
-        data[0:12],
-        data[12:24],
-        data[24:36],
-        data[36:48]
+        view[0:12],
+        view[12:24],
+        view[24:36],
+        view[36:48]
     ]
     
     ordered_blocks = [b'', b'', b'', b'']
@@ -98,9 +112,18 @@ def verify_checksum(substructures: bytes, original_checksum: int) -> bool:
     Returns:
         bool: True if checksum calculates correctly.
     """
-    total = 0
-    for i in range(0, len(substructures), 2):
-        word = struct.unpack('<H', substructures[i:i+2])[0]
-        total = (total + word) & 0xFFFF
-    
+    words = np.frombuffer(substructures, dtype="<u2")
+    total = int(words.sum()) & 0xFFFF
     return total == original_checksum
+
+def compute_checksums(decrypted: np.ndarray) -> np.ndarray:
+    """Computes the substructure checksums of several Pokémon at once.
+
+    Args:
+        decrypted (np.ndarray): (N, 12) array of decrypted little-endian u32 words,
+                                as returned by `decrypt_substructures`.
+
+    Returns:
+        np.ndarray: (N,) array of 16-bit checksums.
+    """
+    return decrypted.view("<u2").sum(axis=1, dtype=np.uint32) & 0xFFFF
@@ -2,6 +2,7 @@ import time
 import os
 import sys
 import logging
+from typing import Dict, List, Tuple
 
 """
 Pokémon Battle Factory (Emerald) - Enriched Observer
@@ -27,20 +28,50 @@ if project_root not in sys.path:
 
 from src.client import MgbaClient
 from src.memory import MemoryReader
-from src.constants import ADDR_PLAYER_PARTY, ADDR_ENEMY_PARTY
+from src.constants import ADDR_PLAYER_PARTY, ADDR_ENEMY_PARTY, BATTLE_OUTCOME_NAMES
+from src.models import Move
 
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def clear_screen() -> None:
-    """Clears the terminal screen for a fresh dashboard update."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+# Cursor home + erase screen and scrollback: what `clear` prints, minus the subprocess
+_CLEAR_SEQ = "\033[H\033[2J\033[3J"
 
-def print_separator(char: str = '-', length: int = 60) -> None:
-    """Prints a visual separator line."""
-    print(char * length)
+def clear_screen() -> None:
+    """Clears the terminal screen for a fresh dashboard update.
+
+    On POSIX terminals this is an escape sequence left in the stdout buffer, so the
+    clear goes out with the frame's single write instead of forking `clear`.
+    """
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        sys.stdout.write(_CLEAR_SEQ)
+
+def separator(char: str = '-', length: int = 60) -> str:
+    """Returns a visual separator line."""
+    return char * length
+
+# Base stat line shared by every section; filled from a species' base_stats dict
+_BASE_STATS_TEMPLATE = "H:{hp} A:{atk} D:{def} SA:{spa} SD:{spd} S:{spe}"
+
+# Move-list strings keyed by move IDs; a mon's moveset rarely changes between frames
+_move_list_cache: Dict[Tuple[int, ...], str] = {}
+# A session only ever shows a few dozen movesets; past this the cache starts over
+_MOVE_LIST_CACHE_MAX = 256
+
+def format_move_list(moves: List[Move]) -> str:
+    """Formats moves as "Name(Typ), ...", reusing the string for a known moveset."""
+    key = tuple(m.id for m in moves)
+    moves_str = _move_list_cache.get(key)
+    if moves_str is None:
+        moves_str = ", ".join(f"{m.name}({m.type[:3]})" for m in moves)
+        if len(_move_list_cache) >= _MOVE_LIST_CACHE_MAX:
+            _move_list_cache.clear()
+        _move_list_cache[key] = moves_str
+    return moves_str
 
 def main():
     client = MgbaClient()
@@ -49,118 +80,132 @@ def main():
     try:
         client.connect()
     except Exception as e:
-        logger.error(f"Failed to connect: {e}")
+        logger.error("Failed to connect: %s", e)
         return
 
     memory = MemoryReader(client)
+    last_snapshot = None
 
     try:
         while True:
             # 1. Capture Snapshot (Bulk Read)
-            start_time = time.time()
+            # Monotonic integer clock; converted to ms only for display
+            start_ns = time.perf_counter_ns()
             snapshot = memory.read_snapshot()
-            req_time = (time.time() - start_time) * 1000
-
-            clear_screen()
-            print(f"=== POKEMON BATTLE FACTORY: ENRICHED OBSERVER ===")
-            print(f"Fetch Time: {req_time:.2f}ms | Timestamp: {snapshot.timestamp:.2f}")
+            fetch_ns = time.perf_counter_ns() - start_ns
+
+            # Skip the clear/redraw when the game state has not changed since the
+            # last frame drawn (snapshot equality ignores the timestamp, RNG seed and
+            # frame count, which move every frame; the RNG shown may lag until a redraw).
+            if snapshot == last_snapshot:
+                continue
+            last_snapshot = snapshot
+
+            # Assemble the whole dashboard first and write it in one go, so each
+            # frame is a single stdout write right after the clear.
+            lines = []
+            emit = lines.append
+            emit(f"=== POKEMON BATTLE FACTORY: ENRICHED OBSERVER ===")
+            emit(f"Fetch Time: {fetch_ns / 1e6:.2f}ms | Timestamp: {snapshot.timestamp:.2f}")
             
-            outcome_map = {0: "Ongoing", 1: "Won", 2: "Lost", 3: "Draw", 4: "Ran"}
-            print(f"Outcome: {outcome_map.get(snapshot.outcome, f'Unknown({snapshot.outcome})')}         Wait Input: {'YES' if snapshot.input_wait else 'NO'}   RNG: {snapshot.rng_seed:X}")
-            print(f"Phase:   {snapshot.phase.ljust(15)} Weather: {snapshot.weather}")
+            emit(f"Outcome: {BATTLE_OUTCOME_NAMES.get(snapshot.outcome, f'Unknown({snapshot.outcome})')}         Wait Input: {'YES' if snapshot.input_wait else 'NO'}   RNG: {snapshot.rng_seed:X}")
+            emit(f"Phase:   {snapshot.phase.ljust(15)} Weather: {snapshot.weather}")
             if snapshot.frontier_info:
                 lvl_str = "Open Level" if snapshot.frontier_info.lvl_mode == 1 else "Level 50"
-                print(f"Frontier: {lvl_str} | Battle #{snapshot.frontier_info.battle_num + 1}")
-            print(f"Last Move (Player): {snapshot.last_move_player.ljust(15)}")
-            print(f"Last Move (Enemy):  {snapshot.last_move_enemy.ljust(35)}")
-            print_separator('=')
+                emit(f"Frontier: {lvl_str} | Battle #{snapshot.frontier_info.battle_num + 1}")
+            emit(f"Last Move (Player): {snapshot.last_move_player.ljust(15)}")
+            emit(f"Last Move (Enemy):  {snapshot.last_move_enemy.ljust(35)}")
+            emit(separator('='))
 
 
             # Show Rental Candidates
             if snapshot.phase in ["RENTAL", "SWAP"] and snapshot.rental_candidates:
-                print(f"RENTAL CANDIDATES / SWAP OPTIONS ({len(snapshot.rental_candidates)})")
+                emit(f"RENTAL CANDIDATES / SWAP OPTIONS ({len(snapshot.rental_candidates)})")
                 for r in snapshot.rental_candidates:
-                    print(f" [{r.slot}] {r.species_name:<15} IVs: {r.ivs:<3} PID: {r.personality:X} Nature: {r.nature}")
+                    emit(f" [{r.slot}] {r.species_name:<15} IVs: {r.ivs:<3} PID: {r.personality:X} Nature: {r.nature}")
                     if r.species_info:
                         bs = r.species_info.base_stats
-                        print(f"      Base: H:{bs['hp']} A:{bs['atk']} D:{bs['def']} SA:{bs['spa']} SD:{bs['spd']} S:{bs['spe']}")
+                        emit(f"      Base: {_BASE_STATS_TEMPLATE.format_map(bs)}")
                     if r.item:
-                        print(f"      Item: {r.item.name:<15} | {r.item.hold_effect} (Param: {r.item.hold_effect_param})")
+                        emit(f"      Item: {r.item.name:<15} | {r.item.hold_effect} (Param: {r.item.hold_effect_param})")
                     if r.moves:
-                        print(f"      Moves:")
+                        emit(f"      Moves:")
                         for m in r.moves:
-                            print(f"       - {m.name:<15} {m.type} {m.split} Pwr:{m.power:<3} Acc:{m.accuracy:<3} PP:{m.pp:<2} {m.effect}")
-                print_separator()
+                            emit(f"       - {m.name:<15} {m.type} {m.split} Pwr:{m.power:<3} Acc:{m.accuracy:<3} PP:{m.pp:<2} {m.effect}")
+                emit(separator())
 
             # Active Battle
             if snapshot.active_battlers:
-                print(f"ACTIVE BATTLERS ({len(snapshot.active_battlers)})")
+                emit(f"ACTIVE BATTLERS ({len(snapshot.active_battlers)})")
                 for mon in snapshot.active_battlers:
                     side = "PLAYER" if mon.slot % 2 == 0 else "ENEMY"
                     status_str = memory._get_status_string(mon.status)
-                    print(f"[{side} SLOT {mon.slot}] {mon.species_name} (Lv.{mon.level}) Nature: {mon.nature}")
-                    print(f"   HP: {mon.hp}/{mon.max_hp} ({mon.pct_hp*100:.0f}%) Status: {status_str}")
+                    emit(f"[{side} SLOT {mon.slot}] {mon.species_name} (Lv.{mon.level}) Nature: {mon.nature}")
+                    emit(f"   HP: {mon.hp}/{mon.max_hp} ({mon.pct_hp*100:.0f}%) Status: {status_str}")
                     
                     if mon.real_stats:
-                        print(f"   Stats: Atk {mon.real_stats.get('atk')} | Def {mon.real_stats.get('def')} | "
+                        emit(f"   Stats: Atk {mon.real_stats.get('atk')} | Def {mon.real_stats.get('def')} | "
                               f"SpA {mon.real_stats.get('spa')} | SpD {mon.real_stats.get('spd')} | Spe {mon.real_stats.get('spe')}")
                     if mon.species_info:
                         bs = mon.species_info.base_stats
-                        print(f"   Base:  H:{bs['hp']} A:{bs['atk']} D:{bs['def']} SA:{bs['spa']} SD:{bs['spd']} S:{bs['spe']}")
+                        emit(f"   Base:  {_BASE_STATS_TEMPLATE.format_map(bs)}")
                     
-                    print(f"   Moves:")
+                    emit(f"   Moves:")
                     for i, move in enumerate(mon.moves):
                         pp_val = mon.pp[i] if i < len(mon.pp) else 0
                         flags = ",".join(move.flags) if move.flags else "-"
-                        print(f"     - {move.name:<15} {move.type[:3].upper()}/{move.split[:4]} Pwr:{move.power:<3} Acc:{move.accuracy:<3}% PP:{pp_val:<2}/{move.pp:<2}")
-                        print(f"       Effect: {move.effect} | Target: {move.target} | Pri: {move.priority} | Flags: {flags}")
-                    print_separator()
+                        emit(f"     - {move.name:<15} {move.type[:3].upper()}/{move.split[:4]} Pwr:{move.power:<3} Acc:{move.accuracy:<3}% PP:{pp_val:<2}/{move.pp:<2}")
+                        emit(f"       Effect: {move.effect} | Target: {move.target} | Pri: {move.priority} | Flags: {flags}")
+                    emit(separator())
 
             # Player Party
-            print("PLAYER PARTY (BENCH)")
+            emit("PLAYER PARTY (BENCH)")
             for i, mon in enumerate(snapshot.player_party):
                 status_str = memory._get_status_string(mon.status)
                 item_str = f"{mon.item.name}" if mon.item else "None"
-                print(f" {i+1}. {mon.nickname} ({mon.species_name}) Lv.{mon.level} Nature: {mon.nature}")
-                print(f"     HP: {mon.hp}/{mon.max_hp} | Item: {item_str} | Status: {status_str}")
+                emit(f" {i+1}. {mon.nickname} ({mon.species_name}) Lv.{mon.level} Nature: {mon.nature}")
+                emit(f"     HP: {mon.hp}/{mon.max_hp} | Item: {item_str} | Status: {status_str}")
                 if mon.item and mon.item.hold_effect != "None":
-                     print(f"     Item Effect: {mon.item.hold_effect} (Param: {mon.item.hold_effect_param})")
+                     emit(f"     Item Effect: {mon.item.hold_effect} (Param: {mon.item.hold_effect_param})")
                 
                 if mon.real_stats:
-                    print(f"     Stats: A:{mon.real_stats.get('atk')} D:{mon.real_stats.get('def')} SA:{mon.real_stats.get('spa')} SD:{mon.real_stats.get('spd')} S:{mon.real_stats.get('spe')}")
+                    emit(f"     Stats: A:{mon.real_stats.get('atk')} D:{mon.real_stats.get('def')} SA:{mon.real_stats.get('spa')} SD:{mon.real_stats.get('spd')} S:{mon.real_stats.get('spe')}")
                 if mon.species_info:
                     bs = mon.species_info.base_stats
-                    print(f"     Base:  H:{bs['hp']} A:{bs['atk']} D:{bs['def']} SA:{bs['spa']} SD:{bs['spd']} S:{bs['spe']}")
+                    emit(f"     Base:  {_BASE_STATS_TEMPLATE.format_map(bs)}")
 
-                print(f"     Moves:")
+                emit(f"     Moves:")
                 for i, move in enumerate(mon.moves):
                      pp_cur = mon.pp[i]
-                     print(f"       - {move.name:<12} {move.type[:3]}/{move.split[:4]} P:{move.power} A:{move.accuracy} PP:{pp_cur}/{move.pp}")
+                     emit(f"       - {move.name:<12} {move.type[:3]}/{move.split[:4]} P:{move.power} A:{move.accuracy} PP:{pp_cur}/{move.pp}")
 
-            print_separator()
+            emit(separator())
 
             # Enemy Party
-            print("ENEMY PARTY (For Swapping)")
+            emit("ENEMY PARTY (For Swapping)")
             for i, mon in enumerate(snapshot.enemy_party):
                 item_str = f"{mon.item.name}" if mon.item else "None"
-                print(f" {i+1}. {mon.species_name} Lv.{mon.level} Item: {item_str}")
+                emit(f" {i+1}. {mon.species_name} Lv.{mon.level} Item: {item_str}")
                 if mon.item and mon.item.hold_effect != "None":
-                     print(f"     Item Effect: {mon.item.hold_effect}")
-                print(f"     HP: {mon.hp}/{mon.max_hp}")
+                     emit(f"     Item Effect: {mon.item.hold_effect}")
+                emit(f"     HP: {mon.hp}/{mon.max_hp}")
                 
                 if mon.real_stats:
-                     print(f"     Stats: A:{mon.real_stats.get('atk')} D:{mon.real_stats.get('def')} SA:{mon.real_stats.get('spa')} SD:{mon.real_stats.get('spd')} S:{mon.real_stats.get('spe')}")
+                     emit(f"     Stats: A:{mon.real_stats.get('atk')} D:{mon.real_stats.get('def')} SA:{mon.real_stats.get('spa')} SD:{mon.real_stats.get('spd')} S:{mon.real_stats.get('spe')}")
                 # Enemy nature? Derived from PID if we had it. Party mon hash PID.
-                print(f"     Nature: {mon.nature}")
+                emit(f"     Nature: {mon.nature}")
                 if mon.species_info:
                     bs = mon.species_info.base_stats
-                    print(f"     Base:  H:{bs['hp']} A:{bs['atk']} D:{bs['def']} SA:{bs['spa']} SD:{bs['spd']} S:{bs['spe']}")
+                    emit(f"     Base:  {_BASE_STATS_TEMPLATE.format_map(bs)}")
                 
-                moves_str = ", ".join([f"{m.name}({m.type[:3]})" for m in mon.moves])
-                print(f"     Moves: {moves_str}")
+                emit(f"     Moves: {format_move_list(mon.moves)}")
+
+            emit(separator('='))
+            emit("Press Ctrl+C to exit.")
 
-            print_separator('=')
-            print("Press Ctrl+C to exit.")
+            clear_screen()
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
             # time.sleep(0.5) 
 
     except KeyboardInterrupt:
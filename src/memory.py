@@ -2,14 +2,65 @@ from typing import List, Optional, Dict
 import struct
 import logging
 import time
+import numpy as np
 from src.client import MgbaClient
 from src.constants import *
-from src.decryption import decrypt_data, unshuffle_substructures, verify_checksum
+from src.decryption import decrypt_substructures, compute_checksums, unshuffle_substructures
 from src.db import PokemonDatabase
-from src.models import PartyPokemon, BattlePokemon, RentalPokemon, BattleFactorySnapshot, FrontierMetadata
+from src.models import (
+    PartyPokemon, BattlePokemon, RentalPokemon, BattleFactorySnapshot, FrontierMetadata,
+    Move, SpeciesInfo, ItemInfo
+)
 
 logger = logging.getLogger(__name__)
 
+# Precompiled struct layouts. Padding bytes ('x') skip fields we do not decode so
+# each record is unpacked in one call straight from the bulk buffer.
+
+# Party mon (100 bytes): PID, [OTID], Nickname, [Lang..Markings, Checksum, Unused, Substructures],
+# Status, Level, [Pokerus Remaining], HP, MaxHP, Atk, Def, Spd, SpAtk, SpDef
+_PARTY_MON_STRUCT = struct.Struct("<I4x10s62xIBxHH5H")
+# Column view of a party block used to decrypt and checksum every slot in one pass
+_PARTY_DTYPE = np.dtype({
+    "names": ["pid", "otid", "checksum", "substructs"],
+    "formats": ["<u4", "<u4", "<u2", ("<u4", 12)],
+    "offsets": [0, 4, 28, 32],
+    "itemsize": SIZE_POKEMON,
+})
+# Unshuffled substructures (48 bytes): Growth, Attacks, EVs (+ condition), Misc
+_SUBSTRUCTS_STRUCT = struct.Struct("<HHIBB2x4H4B6B6xBB2xI4x")
+# Battle mon (88 bytes), offsets as documented in read_battle_mons
+_BATTLE_MON_STRUCT = struct.Struct("<H5H4H10xBBB3x4BHBxHH4xIxB18xII4x")
+# Rental mon (12 bytes): MonID, IVs, Ability, Personality, [OTID]
+_RENTAL_MON_STRUCT = struct.Struct("<HBBI4x")
+_U16 = struct.Struct("<H")
+_LAST_MOVES_STRUCT = struct.Struct("<HH")
+
+# Independent reads behind every snapshot, sent as one pipelined batch (see read_snapshot)
+_SNAPSHOT_COMMANDS = [
+    f"READ_BLOCK {ADDR_BATTLE_REGION:X} {SIZE_BATTLE_REGION:X}",
+    "IS_WAITING_INPUT",
+    f"READ_U32 {ADDR_RNG_VALUE:X}",
+    f"READ_U16 {ADDR_MAP_LAYOUT_ID:X}",
+    f"READ_U16 {ADDR_CHALLENGE_BATTLE_NUM:X}",
+    f"READ_U32 {ADDR_SAVEBLOCK2_PTR:X}",
+]
+
+# Status1 bits -> label, in display order (bits 0-2 are the sleep counter)
+_STATUS_FLAGS = ((0x7, "SLP"), (0x8, "PSN"), (0x10, "BRN"), (0x20, "FRZ"), (0x40, "PAR"), (0x80, "TOX"))
+# Formatted status strings keyed by the raw Status1 value
+_STATUS_STRINGS: Dict[int, str] = {}
+
+# Gen 3 type names indexed by the battle struct's type ID (9 is the unused ??? type)
+TYPE_NAMES = (
+    "Normal", "Fighting", "Flying", "Poison", "Ground", "Rock", "Bug", "Ghost", "Steel",
+    "Mystery", "Fire", "Water", "Grass", "Electric", "Psychic", "Ice", "Dragon", "Dark"
+)
+
+def get_type_name(type_id: int) -> str:
+    """Resolves a Gen 3 type ID to its name (e.g., 10 -> "Fire")."""
+    return TYPE_NAMES[type_id] if 0 <= type_id < len(TYPE_NAMES) else f"Type{type_id}"
+
 def decode_string(data: bytes) -> str:
     """Decodes a Gen 3 character string.
     
@@ -62,42 +113,62 @@ class MemoryReader:
 
     def _get_status_string(self, status: int) -> str:
         """Converts a status bitmask into a human-readable string (e.g., "SLP|PSN")."""
-        if status == 0: return "OK"
-        s = []
-        if status & 0x7: s.append("SLP")
-        if status & 0x8: s.append("PSN")
-        if status & 0x10: s.append("BRN")
-        if status & 0x20: s.append("FRZ")
-        if status & 0x40: s.append("PAR")
-        if status & 0x80: s.append("TOX")
-        return "|".join(s)
-
-
-    def _create_move(self, move_id: int) -> 'Move':
+        # Only a handful of distinct bitmasks occur, so each is formatted once
+        s = _STATUS_STRINGS.get(status)
+        if s is None:
+            s = "|".join(name for mask, name in _STATUS_FLAGS if status & mask) if status else "OK"
+            _STATUS_STRINGS[status] = s
+        return s
+
+
+    def _create_move(self, move_id: int) -> Move:
         """Factory method to create a Move object from an ID."""
-        # Import here to avoid circular dependency if models imports db
-        from src.models import Move
         d = self.db.get_move_details(move_id)
         if not d:
              # Fallback
              return Move(move_id, f"Move {move_id}", "Normal", 0, 0, 0, "", "", 0, [], "Physical")
         return Move(**d)
 
-    def _create_species(self, species_id: int) -> Optional['SpeciesInfo']:
+    def _create_species(self, species_id: int) -> Optional[SpeciesInfo]:
         """Factory method to create a SpeciesInfo object from an ID."""
-        from src.models import SpeciesInfo
         d = self.db.get_species_details(species_id)
         if not d: return None
         return SpeciesInfo(**d)
 
-    def _create_item(self, item_id: int) -> 'ItemInfo':
+    def _create_item(self, item_id: int) -> ItemInfo:
         """Factory method to create an ItemInfo object from an ID."""
-        from src.models import ItemInfo
         d = self.db.get_item_details(item_id)
         if not d: return ItemInfo(item_id, f"Item {item_id}", "", "None", 0)
         return ItemInfo(**d)
 
-    def read_party(self, address: int, count: int = 6) -> List[PartyPokemon]:
+    def prefetch_battle_region(self) -> bytes:
+        """Reads the whole battle region (battle mons through enemy party) in one request.
+
+        The buffer can be handed to `read_party` and `read_battle_mons` so that a
+        snapshot decodes all battle and party structs from a single round-trip.
+
+        Returns:
+            bytes: SIZE_BATTLE_REGION bytes starting at ADDR_BATTLE_REGION.
+        """
+        return self.client.read_block(ADDR_BATTLE_REGION, SIZE_BATTLE_REGION)
+
+    def _read_span(self, address: int, size: int, region: Optional[bytes]) -> bytes:
+        """Returns `size` bytes at `address`, sliced from `region` when one is supplied.
+
+        Slices of the region are zero-copy memoryviews; the struct and NumPy decoders
+        read straight from them without materializing a new bytes object.
+
+        Raises:
+            ValueError: If the requested span lies outside the prefetched region.
+        """
+        if region is None:
+            return self.client.read_block(address, size)
+        start = address - ADDR_BATTLE_REGION
+        if start < 0 or start + size > len(region):
+            raise ValueError(f"Span {address:X}+{size:X} is outside the prefetched battle region")
+        return memoryview(region)[start : start + size]
+
+    def read_party(self, address: int, count: int = 6, region: Optional[bytes] = None) -> List[PartyPokemon]:
         """Reads a list of Pokémon from a party memory block.
         
         This method performs a single bulk read for efficiency and then iterates through
@@ -107,74 +178,58 @@ class MemoryReader:
         Args:
             address (int): Memory address where the party starts (e.g., ADDR_PLAYER_PARTY).
             count (int): Number of Pokémon slots to read (default 6).
+            region (Optional[bytes]): Buffer from `prefetch_battle_region`. When given, the
+                                      party is decoded from it instead of issuing a read.
 
         Returns:
             List[PartyPokemon]: A list of populated PartyPokemon objects. Empty slots are skipped.
         """
         total_size = SIZE_POKEMON * count
         # Bulk read the entire party block
-        party_data = self.client.read_block(address, total_size)
+        party_data = self._read_span(address, total_size, region)
         
+        # Decrypt and checksum all slots at once over the party's column view
+        slots = np.frombuffer(party_data, dtype=_PARTY_DTYPE, count=count)
+        decrypted = decrypt_substructures(slots["substructs"], slots["pid"] ^ slots["otid"])
+        checksum_ok = (compute_checksums(decrypted) == slots["checksum"]).tolist()
+
         party = []
         for i in range(count):
-            offset = i * SIZE_POKEMON
-            data = party_data[offset : offset + SIZE_POKEMON]
-            
-            pid = struct.unpack("<I", data[0:4])[0]
-            
+            (pid, nickname_raw, status, level,
+             hp, max_hp, atk, defense, speed, sp_atk, sp_def) = _PARTY_MON_STRUCT.unpack_from(party_data, i * SIZE_POKEMON)
+
             if pid == 0:
-                continue 
+                continue
+
+            nickname = decode_string(nickname_raw)
+
+            if not checksum_ok[i]:
+                logger.warning("Checksum failed for mon %d PID:%X", i, pid)
+
+            unshuffled = unshuffle_substructures(decrypted[i].tobytes(), pid)
 
-            otid = struct.unpack("<I", data[4:8])[0]
-            nickname = decode_string(data[8:18])
-            checksum = struct.unpack("<H", data[28:30])[0]
-            
-            key = pid ^ otid
-            substruct_data = data[32:80]
-            decrypted = decrypt_data(substruct_data, key)
-            
-            if not verify_checksum(decrypted, checksum):
-                logger.warning(f"Checksum failed for mon {i} PID:{pid:X}")
-                
-            unshuffled = unshuffle_substructures(decrypted, pid)
-            
             # Growth: Species (0-2), Item (2-4), XP (4-8), PPBonuses (8), Friend (9)
-            growth = unshuffled[0:12]
-            species_id = struct.unpack("<H", growth[0:2])[0]
-            item_id = struct.unpack("<H", growth[2:4])[0]
-            exp = struct.unpack("<I", growth[4:8])[0]
-            pp_bonuses = growth[8]
-            friendship = growth[9]
-            
             # Attacks: Move1(0-2)... Move4(6-8), PP1(8)..PP4(11)
-            attacks = unshuffled[12:24]
-            move_ids = [
-                struct.unpack("<H", attacks[0:2])[0],
-                struct.unpack("<H", attacks[2:4])[0],
-                struct.unpack("<H", attacks[4:6])[0],
-                struct.unpack("<H", attacks[6:8])[0],
-            ]
-            pp_values = [attacks[8], attacks[9], attacks[10], attacks[11]]
-            
             # EV & Condition: HP(0), Atk(1), Def(2), Spd(3), SpAtk(4), SpDef(5)...
-            evs_data = unshuffled[24:36]
+            # Condition: Cool(6), Beauty(7), Cute(8), Smart(9), Tough(10), Feel(11) - Skip for now
+            # Misc: Pokerus(0), MetLocation(1), IVs/Egg/Ability u32 (4-8)
+            (species_id, item_id, exp, pp_bonuses, friendship,
+             m1, m2, m3, m4, pp1, pp2, pp3, pp4,
+             ev_hp, ev_atk, ev_def, ev_spe, ev_spa, ev_spd,
+             pokerus, met_location, iv_word) = _SUBSTRUCTS_STRUCT.unpack(unshuffled)
+
+            move_ids = [m1, m2, m3, m4]
+            pp_values = [pp1, pp2, pp3, pp4]
             evs = {
-                "hp": evs_data[0],
-                "atk": evs_data[1],
-                "def": evs_data[2],
-                "spe": evs_data[3],
-                "spa": evs_data[4],
-                "spd": evs_data[5]
+                "hp": ev_hp,
+                "atk": ev_atk,
+                "def": ev_def,
+                "spe": ev_spe,
+                "spa": ev_spa,
+                "spd": ev_spd
             }
-            # Condition: Cool(6), Beauty(7), Cute(8), Smart(9), Tough(10), Feel(11) - Skip for now
-            
-            # Misc: Pokerus, MetLocation, IVs, etc. index 36:48
-            misc = unshuffled[36:48]
-            pokerus = misc[0]
-            met_location = misc[1]
-            
-            # IVs, Egg, Ability are packed into a u32 at offset 4
-            iv_word = struct.unpack("<I", misc[4:8])[0]
+
+            # IVs, Egg, Ability are packed into a u32 at misc offset 4
             # Bitfield:
             # 0-4: HP IV (5 bits)
             # 5-9: Atk IV
@@ -195,19 +250,8 @@ class MemoryReader:
             }
             is_egg = bool((iv_word >> 30) & 1)
             ability_num = (iv_word >> 31) & 1
-            
-            status = struct.unpack("<I", data[80:84])[0]
-            level = data[84]
-            hp = struct.unpack("<H", data[86:88])[0]
-            max_hp = struct.unpack("<H", data[88:90])[0]
-            
+
             # Real Stats (calculated by game and stored in RAM for valid party mons)
-            atk = struct.unpack("<H", data[90:92])[0]
-            defense = struct.unpack("<H", data[92:94])[0]
-            speed = struct.unpack("<H", data[94:96])[0]
-            sp_atk = struct.unpack("<H", data[96:98])[0]
-            sp_def = struct.unpack("<H", data[98:100])[0]
-            
             real_stats = {"atk": atk, "def": defense, "spe": speed, "spa": sp_atk, "spd": sp_def}
             
             party.append(PartyPokemon(
@@ -237,100 +281,58 @@ class MemoryReader:
             
         return party
 
-    def read_battle_mons(self) -> List[BattlePokemon]:
+    def read_battle_mons(self, region: Optional[bytes] = None) -> List[BattlePokemon]:
         """Reads the active battle Pokémon structures.
         
         The game stores transient battle data (stats changes, current HP, etc.) in a
         separate `gBattleMons` array during combat. This method reads all 4 potential slots.
+
+        Args:
+            region (Optional[bytes]): Buffer from `prefetch_battle_region`. When given, the
+                                      battlers are decoded from it instead of issuing a read.
         
         Returns:
             List[BattlePokemon]: List of active battlers (Slot 0=Player, 1=Enemy, etc.).
         """
         total_size = SIZE_BATTLE_MON * 4
-        data_block = self.client.read_block(ADDR_BATTLE_MONS, total_size)
+        data_block = self._read_span(ADDR_BATTLE_MONS, total_size, region)
         
         battle_mons = []
         for i in range(4):
             offset = i * SIZE_BATTLE_MON
-            data = data_block[offset : offset + SIZE_BATTLE_MON]
-            
-            species_id = struct.unpack("<H", data[0:2])[0]
+
+            species_id = _U16.unpack_from(data_block, offset)[0]
             if species_id == 0:
                 continue
-            
-            # Battle Struct Stats
-            # 0x00 Species
-            # 0x02 Attack
-            # 0x04 Defense
-            # 0x06 Speed
-            # 0x08 SpAtk
-            # 0x0A SpDef
-            atk = struct.unpack("<H", data[2:4])[0]
-            defense = struct.unpack("<H", data[4:6])[0]
-            speed = struct.unpack("<H", data[6:8])[0]
-            sp_atk = struct.unpack("<H", data[8:10])[0]
-            sp_def = struct.unpack("<H", data[10:12])[0]
-            
-            real_stats = {"atk": atk, "def": defense, "spe": speed, "spa": sp_atk, "spd": sp_def}
 
             # Offsets based on pokeemerald struct BattlePokemon
+            # 0x00 Species
+            # 0x02 Attack, 0x04 Defense, 0x06 Speed, 0x08 SpAtk, 0x0A SpDef
             # 0x0C (12) - Moves
-            moves_coords = [
-                struct.unpack("<H", data[12:14])[0],
-                struct.unpack("<H", data[14:16])[0],
-                struct.unpack("<H", data[16:18])[0],
-                struct.unpack("<H", data[18:20])[0],
-            ]
-            
             # 0x1E (30) - Ability
-            ability_id = data[30]
             # 0x1F (31) - Types
-            type1_id = data[31]
-            type2_id = data[32]
-            
             # 0x24 (36) - PP
-            pp = [data[36], data[37], data[38], data[39]]
-            
             # 0x28 (40) - HP
-            hp = struct.unpack("<H", data[40:42])[0]
             # 0x2A (42) - Level
-            level = data[42]
             # 0x2C (44) - MaxHP (matches prev code)
-            max_hp = struct.unpack("<H", data[44:46])[0]
-            
             # 0x2E (46) - Held Item (Active)
-            item_id = struct.unpack("<H", data[46:48])[0]
-            
+            # 0x34 (52) - PID (Previous code said 52. Let's keep it.)
             # 0x39 (57) - PP Bonuses
-            pp_bonuses = data[57]
-            
             # 0x4C (76) - Status1 (Sleep, Poison, etc)
-            status = struct.unpack("<I", data[76:80])[0]
-            
             # 0x50 (80) - Status2 (Volatile: Confusion, etc)
-            status2 = struct.unpack("<I", data[80:84])[0]
+            (_, atk, defense, speed, sp_atk, sp_def,
+             mv1, mv2, mv3, mv4,
+             ability_id, type1_id, type2_id,
+             pp1, pp2, pp3, pp4,
+             hp, level, max_hp, item_id, pid, pp_bonuses,
+             status, status2) = _BATTLE_MON_STRUCT.unpack_from(data_block, offset)
+
+            real_stats = {"atk": atk, "def": defense, "spe": speed, "spa": sp_atk, "spd": sp_def}
+            moves_coords = [mv1, mv2, mv3, mv4]
+            pp = [pp1, pp2, pp3, pp4]
 
             species_name = self.db.get_species_name(species_id)
             moves = [self._create_move(m_id) for m_id in moves_coords]
-            
-            # PID at offset 52 (0x34) in Gen 3 Battle Struct?
-            # Previous code said 52. Let's keep it.
-            pid = struct.unpack("<I", data[52:56])[0]
-            
-            # Resolve Types strings
-            # We assume type IDs match standard Gen 3 types. 
-            # 0=Normal, 1=Fighting, etc.
-            # We can use a helper or simple map. 
-            # For strict correctness we should have get_type_name.
-            # I'll stick to raw IDs or a default string for now, or use models.
-            # Actually models has type as string. 
-            # Let's add get_type_name to DB or simple map here to be safe.
-            type_map = [
-                "Normal", "Fighting", "Flying", "Poison", "Ground", "Rock", "Bug", "Ghost", "Steel",
-                "Mystery", "Fire", "Water", "Grass", "Electric", "Psychic", "Ice", "Dragon", "Dark"
-            ]
-            def get_type_str(tid):
-                return type_map[tid] if 0 <= tid < len(type_map) else f"Type{tid}"
 
             battle_mons.append(BattlePokemon(
                 slot=i,
@@ -345,8 +347,8 @@ class MemoryReader:
                 real_stats=real_stats,
                 species_info=self._create_species(species_id),
                 pid=pid,
-                type1=get_type_str(type1_id),
-                type2=get_type_str(type2_id),
+                type1=get_type_name(type1_id),
+                type2=get_type_name(type2_id),
                 ability_id=ability_id,
                 item_id=item_id,
                 status2=status2,
@@ -354,7 +356,7 @@ class MemoryReader:
             ))
         return battle_mons
 
-    def read_rental_mons(self) -> List[RentalPokemon]:
+    def read_rental_mons(self, sb2: Optional[int] = None) -> List[RentalPokemon]:
         """Reads the available rental/swap Pokémon in the Battle Factory.
         
         Rental Pokémon are stored in a contiguous array in the Battle Frontier data section.
@@ -362,11 +364,16 @@ class MemoryReader:
         enriches it with static move/item data from the database since the game doesn't
         store moves continuously in RAM for rentals.
 
+        Args:
+            sb2 (Optional[int]): Already-dereferenced SaveBlock2 address. Read from
+                                 ADDR_SAVEBLOCK2_PTR when not supplied.
+
         Returns:
             List[RentalPokemon]: List of the 3 (initial) or 6 (swap) logical options.
         """
         # Pointer to SaveBlock2
-        sb2 = self.client.read_u32(ADDR_SAVEBLOCK2_PTR)
+        if sb2 is None:
+            sb2 = self.client.read_u32(ADDR_SAVEBLOCK2_PTR)
         if not sb2: return []
         
         # Rentals are at offset 0xE70 from SaveBlock2
@@ -375,14 +382,8 @@ class MemoryReader:
         
         rentals = []
         for i in range(6):
-            offset = i * SIZE_RENTAL_MON
             # Struct: MonID (2), IVs (1), Ability (1), Personality (4), OTID (4) = 12 bytes
-            mon_data = data[offset:offset+12]
-            
-            facility_mon_id = struct.unpack("<H", mon_data[0:2])[0]
-            ivs = mon_data[2]
-            ability = mon_data[3]
-            pid = struct.unpack("<I", mon_data[4:8])[0]
+            facility_mon_id, ivs, ability, pid = _RENTAL_MON_STRUCT.unpack_from(data, i * SIZE_RENTAL_MON)
             
             # We need to query battle_frontier_mons table to get moves/item for this facility mon
             cursor = self.db.conn.cursor()
@@ -401,9 +402,9 @@ class MemoryReader:
                  item = self._create_item(item_id)
                  
                  if not moves:
-                     logger.warning(f"Rental Mon {i} (ID: {facility_mon_id}) found in DB but has NO moves! MoveIDs: {move_ids}")
+                     logger.warning("Rental Mon %d (ID: %d) found in DB but has NO moves! MoveIDs: %s", i, facility_mon_id, move_ids)
             else:
-                 logger.warning(f"Rental Mon {i} (ID: {facility_mon_id}) NOT found in battle_frontier_mons table!")
+                 logger.warning("Rental Mon %d (ID: %d) NOT found in battle_frontier_mons table!", i, facility_mon_id)
                  species_id = facility_mon_id # Fallback if ID matches species directly (unlikely)
                  moves = []
                  item = None
@@ -421,18 +422,24 @@ class MemoryReader:
             ))
         return rentals
 
-    def read_frontier_metadata(self) -> Optional[FrontierMetadata]:
-        """Reads Battle Frontier metadata from SaveBlock2."""
-        sb2 = self.client.read_u32(ADDR_SAVEBLOCK2_PTR)
+    def read_frontier_metadata(self, sb2: Optional[int] = None) -> Optional[FrontierMetadata]:
+        """Reads Battle Frontier metadata from SaveBlock2.
+
+        Args:
+            sb2 (Optional[int]): Already-dereferenced SaveBlock2 address. Read from
+                                 ADDR_SAVEBLOCK2_PTR when not supplied.
+        """
+        if sb2 is None:
+            sb2 = self.client.read_u32(ADDR_SAVEBLOCK2_PTR)
         if not sb2: return None
         
         # Read Frontier Vars
-        # lv_mode: u8 at OFFSET_FRONTIER_LVL_MODE
-        lvl_mode = self.client.read_u8(sb2 + OFFSET_FRONTIER_LVL_MODE)
-        
-        # battle_num: u16 at OFFSET_FRONTIER_BATTLE_NUM
-        # Note: logic in constants.py says u16.
-        battle_num = self.client.read_u16(sb2 + OFFSET_FRONTIER_BATTLE_NUM)
+        # lv_mode (u8) and battle_num (u16) are only a few bytes apart, so fetch
+        # both with a single block read instead of two round-trips.
+        span = OFFSET_FRONTIER_BATTLE_NUM + 2 - OFFSET_FRONTIER_LVL_MODE
+        frontier_data = self.client.read_block(sb2 + OFFSET_FRONTIER_LVL_MODE, span)
+        lvl_mode = frontier_data[0]
+        battle_num = _U16.unpack_from(frontier_data, OFFSET_FRONTIER_BATTLE_NUM - OFFSET_FRONTIER_LVL_MODE)[0]
         
         # We can infer rental count or read it if we had an offset?
         # For now, just placeholder or deduce from rental array size?
@@ -460,15 +467,25 @@ class MemoryReader:
         Returns:
              BattleFactorySnapshot: A fully populated snapshot of the current frame.
         """
+        # Battle mons, last moves, outcome, weather and both parties share one
+        # contiguous block; it is fetched together with every independent scalar
+        # in a single pipelined round-trip and decoded below.
+        replies = self.client.send_many(_SNAPSHOT_COMMANDS)
+        for cmd, reply in zip(_SNAPSHOT_COMMANDS, replies):
+            if reply.startswith("ERROR"):
+                raise ValueError(f"Snapshot read failed for {cmd}: {reply}")
+        region_hex, waiting, rng, map_layout, challenge_battle_num, sb2 = replies
+        region = bytes.fromhex(region_hex)
+
         # 1. Read Critical State Variables
-        outcome = self.client.read_u16(ADDR_BATTLE_OUTCOME) & 0xFF # Read u16 and mask to avoid single-byte read issues
-        input_wait = self.client.input_waiting()
-        rng = self.client.read_u32(ADDR_RNG_VALUE)
-        map_layout = self.client.read_u16(ADDR_MAP_LAYOUT_ID)
-        challenge_battle_num = self.client.read_u16(ADDR_CHALLENGE_BATTLE_NUM)
+        outcome = region[ADDR_BATTLE_OUTCOME - ADDR_BATTLE_REGION]
+        input_wait = waiting == "YES"
+        rng = int(rng)
+        map_layout = int(map_layout)
+        challenge_battle_num = int(challenge_battle_num)
         
         # Weather
-        weather_flags = self.client.read_u16(ADDR_BATTLE_WEATHER)
+        weather_flags = _U16.unpack_from(region, ADDR_BATTLE_WEATHER - ADDR_BATTLE_REGION)[0]
         weather_str = "Clear"
         if weather_flags & (WEATHER_RAIN_TEMPORARY | WEATHER_RAIN_DOWNPOUR | WEATHER_RAIN_PERMANENT):
             weather_str = "Rain"
@@ -481,15 +498,13 @@ class MemoryReader:
 
         
         # 2. Last Moves
-        last_moves_data = self.client.read_block(ADDR_LAST_MOVES, 8) 
-        last_move_player_id = struct.unpack("<H", last_moves_data[0:2])[0]
-        last_move_enemy_id = struct.unpack("<H", last_moves_data[2:4])[0]
+        last_move_player_id, last_move_enemy_id = _LAST_MOVES_STRUCT.unpack_from(region, ADDR_LAST_MOVES - ADDR_BATTLE_REGION)
         last_move_player = self.db.get_move_name(last_move_player_id) if last_move_player_id else "-"
         last_move_enemy = self.db.get_move_name(last_move_enemy_id) if last_move_enemy_id else "-"
         
         # 3. Read Parties (Needed for Phase Detection)
-        player_party = self.read_party(ADDR_PLAYER_PARTY)
-        enemy_party = self.read_party(ADDR_ENEMY_PARTY)
+        player_party = self.read_party(ADDR_PLAYER_PARTY, region=region)
+        enemy_party = self.read_party(ADDR_ENEMY_PARTY, region=region)
         
         # 4. Phase Detection Logic
         # | Phase | Layout | Party | Round |
@@ -515,15 +530,18 @@ class MemoryReader:
             phase = f"UNKNOWN(Map:{map_layout})"
 
         # 5. Read Battle Mons (Only relevant if in Battle phase usually, but good to have)
-        active_battlers = self.read_battle_mons()
+        active_battlers = self.read_battle_mons(region)
         
+        # SaveBlock2 is dereferenced once per snapshot and shared by steps 6 and 7
+        sb2 = int(sb2)
+
         # 6. Read Rentals (Only needed in Rental/Swap)
         rental_candidates = []
         if phase in ["RENTAL", "SWAP"]:
-            rental_candidates = self.read_rental_mons()
+            rental_candidates = self.read_rental_mons(sb2)
         
         # 7. Read Frontier Metadata
-        frontier_info = self.read_frontier_metadata()
+        frontier_info = self.read_frontier_metadata(sb2)
         
         return BattleFactorySnapshot(
             timestamp=time.time(),
@@ -545,7 +563,7 @@ class MemoryReader:
         """Deprecated: Use read_snapshot() instead."""
         snapshot = self.read_snapshot()
         return {
-            "outcome": {0: "Ongoing", 1: "Won", 2: "Lost", 3: "Draw", 4: "Ran"}.get(snapshot.outcome, f"Unknown({snapshot.outcome})"),
+            "outcome": BATTLE_OUTCOME_NAMES.get(snapshot.outcome, f"Unknown({snapshot.outcome})"),
             "input_wait": "YES" if snapshot.input_wait else "NO",
             "rng": snapshot.rng_seed,
             "last_move_player": snapshot.last_move_player,
@@ -257,24 +257,27 @@ class BattleFactorySnapshot:
     containing all data read from memory and enriched from the database.
 
     Attributes:
-        timestamp (float): Time when the snapshot was taken.
+        timestamp (float): Time when the snapshot was taken. Excluded from equality so
+                           two snapshots of the same game state compare equal.
         phase (str): Current game phase ("BATTLE", "RENTAL", "MENU", "IDLE").
         outcome (int): Battle outcome flag (0=Ongoing, 1=Win, etc.).
         input_wait (bool): True if the game is waiting for user input.
-        rng_seed (int): Current RNG seed value.
+        rng_seed (int): Current RNG seed value. Excluded from equality: the game
+                        advances it every frame even when nothing else changes.
         last_move_player (str): Name of the last move used by the player.
         last_move_enemy (str): Name of the last move used by the enemy.
         player_party (List[PartyPokemon]): The player's current party.
         enemy_party (List[PartyPokemon]): The enemy's party (revealed so far).
         active_battlers (List[BattlePokemon]): Pokémon currently in the active battle slots.
         rental_candidates (List[RentalPokemon]): Available Pokémon for rental/swap.
-        frame_count (int): (Optional) Frame counter from emulator.
+        frame_count (int): (Optional) Frame counter from emulator. Excluded from
+                           equality, like rng_seed.
     """
-    timestamp: float
+    timestamp: float = field(compare=False)
     phase: str  # "BATTLE", "RENTAL", "MENU", "IDLE"
     outcome: int
     input_wait: bool
-    rng_seed: int
+    rng_seed: int = field(compare=False)
     weather: str
     
     # Context
@@ -288,7 +291,7 @@ class BattleFactorySnapshot:
     rental_candidates: List[RentalPokemon]
     
     # Metadata
-    frame_count: int = 0  # Could be useful if we track frames
+    frame_count: int = field(default=0, compare=False)  # Could be useful if we track frames
     frontier_info: Optional[FrontierMetadata] = None
 
 